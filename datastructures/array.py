@@ -7,9 +7,14 @@
 """
 
 from __future__ import annotations
-from collections.abc import Sequence
+import bisect
+from collections.abc import Iterable, Sequence
+import math
+import numbers
 import os
-from typing import Any, Iterator, overload
+import struct
+from typing import Any, Callable, Iterator, overload
+import weakref
 import numpy as np
 from numpy.typing import NDArray
 
@@ -18,26 +23,228 @@ from numpy.typing import NDArray
 from datastructures.iarray import IArray, T
 
 
+# Primitive data types are stored in native NumPy buffers so construction and bulk operations
+# run as single vectorized calls. Every other data type is stored as Python objects.
+_PRIMITIVE_DTYPES: dict[type, type] = {int: np.int64, float: np.float64, bool: np.bool_}
+_PRIMITIVE_KINDS: dict[type, str] = {int: 'iub', float: 'fiub', bool: 'b'}
+_PRIMITIVE_SCALARS: dict[type, tuple[type, ...]] = {
+    int: (int, np.integer, np.bool_),
+    float: (float, int, np.floating, np.integer, np.bool_),
+    bool: (bool, np.bool_),
+}
+_REAL_SCALARS: tuple[type, ...] = (numbers.Real, np.bool_)  # Compare by value against any primitive buffer
+
+# Memory-mapped files start with a fixed header (magic, dtype, head offset, logical size) followed by the buffer.
+_MMAP_MAGIC = b'CSARRAY1'
+_MMAP_HEADER = struct.Struct('<8s8sqq')
+_MMAP_OFFSET = 64
+
+
+def _write_mmap_header(path: str, dtype: np.dtype, head: int, logical_size: int) -> None:
+    with open(path, 'r+b') as file:
+        file.write(_MMAP_HEADER.pack(_MMAP_MAGIC, dtype.str.encode(), head, logical_size))
+
+
 class Array(IArray[T]):  
 
-    def __init__(self, starting_sequence: Sequence[T]=[], data_type: type=object) -> None: 
-        self._logical_size: int = len(starting_sequence)
-        self._physical_size: int = self._logical_size
+    def __init__(self, starting_sequence: Sequence[T]=[], data_type: type=object,
+                 growth_factor: float=2.0, shrink_threshold: float | None=None, is_sorted: bool=False) -> None: 
+        if not isinstance(starting_sequence, (Sequence, np.ndarray)):
+            raise ValueError('starting_sequence must be a valid sequence type')
+        if growth_factor <= 1:
+            raise ValueError('growth_factor must be greater than 1')
+        if shrink_threshold is None:
+            shrink_threshold = 1 / (2 * growth_factor)
+        # After growing the array is 1/growth_factor full, after shrinking it is 1/growth_factor full again,
+        # so the shrink threshold must sit below that to leave a band where neither happens.
+        if not 0 <= shrink_threshold < 1 / growth_factor:
+            raise ValueError('shrink_threshold must be between 0 and 1/growth_factor')
+
         self._data_type: type = data_type
+        self._dtype: type = _PRIMITIVE_DTYPES.get(data_type, object)
+        self._growth_factor: float = growth_factor
+        self._shrink_threshold: float = shrink_threshold
+        self._items: NDArray = self._validated(starting_sequence)
+        self._head: int = 0
+        self._logical_size: int = len(self._items)
+        self._physical_size: int = self._logical_size
+        self._reserved: int = 0  # Capacity floor set by reserve(); automatic shrinking never goes below it
+        self._views: weakref.WeakValueDictionary[int, ArrayView[T]] | None = None
+        self._mmap_path: str | None = None
+        self._mmap_mode: str | None = None
+        self._sorted: bool = is_sorted
+        if is_sorted and not self._is_sorted(self._items):
+            raise ValueError('starting_sequence is not sorted')
 
-        if not isinstance(starting_sequence, Sequence):
-            raise ValueError('starting_sequence must be a valid sequence type')
-        
-        for index in range(self._logical_size):
-            if not isinstance(starting_sequence[index], self._data_type):
+    def _init_like(self, template: Array[T], items: NDArray, is_sorted: bool) -> None:
+        self._data_type = template._data_type
+        self._dtype = template._dtype
+        self._growth_factor = template._growth_factor
+        self._shrink_threshold = template._shrink_threshold
+        self._items = items
+        self._head = 0
+        self._logical_size = len(items)
+        self._physical_size = len(items)
+        self._reserved = 0
+        self._views = None
+        self._mmap_path = None
+        self._mmap_mode = None
+        self._sorted = is_sorted
+
+    def _like(self, items: NDArray, is_sorted: bool=False) -> Array[T]:
+        array = Array.__new__(Array)
+        array._init_like(self, items, is_sorted)
+        return array
+
+    @staticmethod
+    def open_mmap(path: str | os.PathLike, data_type: type=int, mode: str='r+', capacity: int=0) -> Array:
+        """ Opens an Array backed by a memory-mapped file. Mode 'w+' creates (or overwrites) the file,
+            'r+' reopens it for reading and writing and 'r' reopens it read-only. Call flush() or close()
+            to record the logical size in the file.
+        """
+        if data_type not in _PRIMITIVE_DTYPES:
+            raise ValueError('Memory-mapped arrays only support int, float and bool data types')
+        if mode not in ('r', 'r+', 'w+'):
+            raise ValueError("mode must be 'r', 'r+' or 'w+'")
+
+        array: Array = Array([], data_type)
+        dtype = np.dtype(array._dtype)
+        path = os.fspath(path)
+        if mode == 'w+':
+            head, logical_size, physical_size = 0, 0, max(1, capacity)
+            with open(path, 'wb') as file:
+                file.truncate(_MMAP_OFFSET + physical_size * dtype.itemsize)
+            _write_mmap_header(path, dtype, head, logical_size)
+        else:
+            with open(path, 'rb') as file:
+                magic, dtype_code, head, logical_size = _MMAP_HEADER.unpack(file.read(_MMAP_HEADER.size))
+            physical_size = (os.path.getsize(path) - _MMAP_OFFSET) // dtype.itemsize
+            if magic != _MMAP_MAGIC or dtype_code.rstrip(b'\0').decode() != dtype.str:
+                raise ValueError(f'{path} is not a memory-mapped Array of {data_type}')
+            if head < 0 or logical_size < 0 or head + logical_size > physical_size:
+                raise ValueError(f'{path} has a corrupt header')
+
+        array._mmap_path = path
+        array._mmap_mode = mode
+        array._items = np.memmap(path, dtype=dtype, mode='r' if mode == 'r' else 'r+',
+                                 offset=_MMAP_OFFSET, shape=(physical_size,))
+        array._head = head
+        array._logical_size = logical_size
+        array._physical_size = physical_size
+        return array
+
+    def flush(self) -> None:
+        if self._mmap_path is not None and self._mmap_mode != 'r':
+            self._items.flush()
+            _write_mmap_header(self._mmap_path, self._items.dtype, self._head, self._logical_size)
+
+    def close(self) -> None:
+        """ Flushes a memory-mapped Array and releases the mapping, leaving the Array empty. """
+        if self._mmap_path is not None:
+            self.flush()
+            self._detach_views()
+            self._items = np.empty(0, dtype=self._dtype)
+            self._head = self._logical_size = self._physical_size = 0
+            self._mmap_path = self._mmap_mode = None
+
+    def __enter__(self) -> Array[T]:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state['_views'] = None
+        if self._mmap_path is not None:
+            # A copy gets its own in-memory buffer so that it never writes to or remaps the file.
+            state['_items'] = np.array(self._items)
+            state['_mmap_path'] = state['_mmap_mode'] = None
+        return state
+
+    def _register_view(self, view: ArrayView[T]) -> None:
+        if self._views is None:
+            self._views = weakref.WeakValueDictionary()
+        self._views[id(view)] = view
+
+    def _check_writable(self) -> None:
+        if self._mmap_mode == 'r':
+            raise ValueError('Memory-mapped array is read-only')
+
+    def _prepare_write(self) -> None:
+        self._check_writable()
+        self._detach_views()
+
+    def _detach_views(self) -> None:
+        # Views share this buffer until it is written to in place; give each live view its own copy first.
+        # Reallocations leave the old buffer untouched, so they never need to detach views.
+        if self._views:
+            for view in list(self._views.values()):
+                view._detach()
+            self._views.clear()
+
+    @property
+    def is_primitive(self) -> bool:
+        return self._dtype is not object
+
+    def _validated(self, sequence: Iterable[T]) -> NDArray:
+        if self.is_primitive:
+            values = np.asarray(sequence if isinstance(sequence, (Sequence, np.ndarray)) else list(sequence))
+            if values.size and values.ndim == 1 and values.dtype.kind == 'O' and self._data_type is not bool \
+                    and all(isinstance(item, int) and not isinstance(item, bool) for item in values):
+                # NumPy falls back to objects for ints beyond 64 bits; those fit a float but never an int64.
+                if self._data_type is int:
+                    raise OverflowError('Items in starting sequence are out of range for int')
+                return values.astype(self._dtype)
+            if values.size and (values.ndim != 1 or values.dtype.kind not in _PRIMITIVE_KINDS[self._data_type]):
                 raise TypeError('Items in starting sequence are not all the same type')
-            
-        self._items: NDArray = np.empty(self._physical_size, dtype=self._data_type)
+            if self._data_type is int and values.dtype.kind == 'u' and values.size and values.max() > np.iinfo(np.int64).max:
+                raise OverflowError('Items in starting sequence are out of range for int')
+            return values.astype(self._dtype, copy=True)
 
-        for index in range(self._logical_size):
-            self._items[index] = starting_sequence[index]
+        if not isinstance(sequence, (Sequence, np.ndarray)):
+            sequence = list(sequence)
+        for item in sequence:
+            if not isinstance(item, self._data_type):
+                raise TypeError('Items in starting sequence are not all the same type')
+        return np.fromiter(sequence, dtype=object, count=len(sequence))
+
+    def _check_type(self, item: Any) -> None:
+        if not self._accepts(item):
+            raise TypeError(f'Item must be of type {self._data_type}')
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.dtype(self._dtype)
+
+    def to_numpy(self, copy: bool=True) -> NDArray:
+        return self._live().copy() if copy else self._live()
+
+    @property
+    def is_sorted(self) -> bool:
+        return self._sorted
 
-        raise NotImplementedError('Constructor not implemented.')
+    @staticmethod
+    def _is_sorted(items: NDArray) -> bool:
+        return len(items) < 2 or bool(np.all(items[:-1] <= items[1:]))
+
+    def sort(self) -> None:
+        self._prepare_write()
+        self._live().sort()
+        self._sorted = True
+
+    def _accepts(self, item: Any) -> bool:
+        return isinstance(item, _PRIMITIVE_SCALARS.get(self._data_type, self._data_type))
+
+    def _live(self) -> NDArray:
+        return self._items[self._head:self._head + self._logical_size]
+
+    def _index(self, index: int) -> int:
+        if index < 0:
+            index += self._logical_size
+        if index < 0 or index >= self._logical_size:
+            raise IndexError('Index out of range')
+        return self._head + index
 
     @overload
     def __getitem__(self, index: int) -> T: ...
@@ -45,45 +252,114 @@ class Array(IArray[T]):
     def __getitem__(self, index: slice) -> Sequence[T]: ...
     def __getitem__(self, index: int | slice) -> T | Sequence[T]:
         if isinstance(index, int):
-            if index < 0 or index >= self._logical_size:
-                raise IndexError('Index out of range')
-            return self._items[index]
+            return self._items[self._index(index)]
         elif isinstance(index, slice):
-            return self._items[index.start:index.stop:index.step]
+            return ArrayView(self, index)
         else:
             raise TypeError('Invalid argument type')
 
     def __setitem__(self, index: int, item: T) -> None:
-        if index < 0 or index >= self._logical_size:
-            raise IndexError('Index out of range')
-        self._items[index] = item
+        position = self._index(index)
+        self._check_type(item)
+        self._prepare_write()
+        self._items[position] = item
+        self._sorted = False
 
     def append(self, data: T) -> None:
-        if self._logical_size >= self._physical_size:
+        self._check_type(data)
+        self._prepare_write()
+        if self._sorted and self._logical_size and data < self._items[self._head + self._logical_size - 1]:
+            self._sorted = False
+        if self._head + self._logical_size >= self._physical_size:
             self._resize()
-        self._items[self._logical_size] = data
+        self._items[self._head + self._logical_size] = data
         self._logical_size += 1
 
     def append_front(self, data: T) -> None:
-        if self._logical_size >= self._physical_size:
-            self._resize()
-        self._items[1:self._logical_size+1] = self._items[0:self._logical_size]
-        self._items[0] = data
+        self._check_type(data)
+        self._prepare_write()
+        if self._sorted and self._logical_size and data > self._items[self._head]:
+            self._sorted = False
+        if self._head == 0:
+            self._resize(front=True)
+        self._head -= 1
+        self._items[self._head] = data
         self._logical_size += 1
 
+    def extend(self, items: Iterable[T]) -> None:
+        values = self._validated(items)
+        self._prepare_write()
+        if self._sorted and len(values):
+            self._sorted = self._is_sorted(values) and (self._logical_size == 0 or self[-1] <= values[0])
+        end = self._head + self._logical_size
+        if end + len(values) > self._physical_size:
+            self._reallocate(max(self._grown_size(), end + len(values)), self._head)
+            end = self._head + self._logical_size
+        self._items[end:end + len(values)] = values
+        self._logical_size += len(values)
+
+    def fill(self, value: T) -> None:
+        self._check_type(value)
+        self._prepare_write()
+        self._live().fill(value)
+
+    def map_inplace(self, function: Callable[[Any], Any]) -> None:
+        """ Replaces every item with function(item). For primitive arrays the function is called once
+            with the whole NumPy buffer, so it must be vectorizable (a ufunc or arithmetic expression).
+        """
+        self._prepare_write()
+        self._sorted = False
+        live = self._live()
+        if self.is_primitive:
+            live[:] = self._validated(np.broadcast_to(function(live), live.shape))
+            return
+        for index in range(self._logical_size):
+            item = function(live[index])
+            self._check_type(item)
+            live[index] = item
+
+    def sum(self) -> T:
+        if self.is_primitive:
+            return self._live().sum().item()
+        return sum(self._live())
+
+    def min(self) -> T:
+        if self._logical_size == 0:
+            raise ValueError('min() of an empty array')
+        if self.is_primitive:
+            return self._live().min().item()
+        return min(self._live())
+
+    def max(self) -> T:
+        if self._logical_size == 0:
+            raise ValueError('max() of an empty array')
+        if self.is_primitive:
+            return self._live().max().item()
+        return max(self._live())
+
+    def filter(self, mask: Sequence[bool] | NDArray) -> Array[T]:
+        mask = np.asarray(mask)
+        if mask.dtype != np.bool_ or mask.shape != (self._logical_size,):
+            raise ValueError('mask must be a sequence of booleans with the same length as the array')
+        return self._like(self._live()[mask], self._sorted)
+
     def pop(self) -> T:
+        self._check_writable()
         if self._logical_size == 0:
             raise IndexError('Pop from empty array')
-        value = self._items[self._logical_size - 1]
+        value = self._items[self._head + self._logical_size - 1]
         self._logical_size -= 1
+        self._shrink()
         return value
     
     def pop_front(self) -> T:
+        self._check_writable()
         if self._logical_size == 0:
             raise IndexError('Pop from empty array')
-        value = self._items[0]
-        self._items[0:self._logical_size-1] = self._items[1:self._logical_size]
+        value = self._items[self._head]
+        self._head += 1
         self._logical_size -= 1
+        self._shrink()
         return value
 
     def __len__(self) -> int: 
@@ -92,39 +368,185 @@ class Array(IArray[T]):
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Array):
             return NotImplemented
+        if self is other:
+            return True
         if self._logical_size != other._logical_size:
             return False
-        return all(self._items[i] == other._items[i] for i in range(self._logical_size))
+        if self.is_primitive and other.is_primitive:
+            return bool(np.array_equal(self._live(), other._live()))
+        return all(left == right for left, right in zip(self._live(), other._live()))
     
     def __iter__(self) -> Iterator[T]:
-        return iter(self._items[:self._logical_size])
+        return iter(self._live())
 
     def __reversed__(self) -> Iterator[T]:
-        return reversed(self._items[:self._logical_size])
+        return reversed(self._live())
 
     def __delitem__(self, index: int) -> None:
-        if index < 0 or index >= self._logical_size:
-            raise IndexError('Index out of range')
-        self._items[index:self._logical_size-1] = self._items[index+1:self._logical_size]
+        position = self._index(index)
+        index = position - self._head
+        self._prepare_write()
+        # Close the gap by shifting whichever side of the deleted item is shorter.
+        if index < self._logical_size // 2:
+            self._items[self._head + 1:position + 1] = self._items[self._head:position]
+            self._head += 1
+        else:
+            end = self._head + self._logical_size
+            self._items[position:end - 1] = self._items[position + 1:end]
         self._logical_size -= 1
+        self._shrink()
 
     def __contains__(self, item: Any) -> bool:
-        return item in self._items[:self._logical_size]
+        try:
+            self.index(item)
+        except ValueError:
+            return False
+        return True
+
+    def index(self, item: Any, start: int=0, stop: int | None=None) -> int:
+        start, stop, _ = slice(start, stop).indices(self._logical_size)
+        # Primitive buffers compare with any real number by value; binary search over objects needs the array's type.
+        if self.is_primitive:
+            searchable = isinstance(item, _REAL_SCALARS)
+        else:
+            searchable = self._accepts(item) or not self._sorted
+        if start < stop and searchable:
+            live = self._live()[start:stop]
+            if self._sorted:
+                try:
+                    position = np.searchsorted(live, item) if self.is_primitive else bisect.bisect_left(live, item)
+                except TypeError:
+                    position = len(live)
+                if position < len(live) and live[position] == item:
+                    return start + int(position)
+            elif self.is_primitive:
+                matches = live == item
+                position = int(matches.argmax())
+                if matches[position]:
+                    return start + position
+            elif item in (items := live.tolist()):
+                return start + items.index(item)
+        raise ValueError(f'{item} is not in array')
+
+    def count(self, item: Any) -> int:
+        if self.is_primitive:
+            return int(np.count_nonzero(self._live() == item)) if isinstance(item, _REAL_SCALARS) else 0
+        return self._live().tolist().count(item)
 
     def clear(self) -> None:
+        """ Removes every item and releases the buffer down to the capacity set by reserve(). """
+        self._check_writable()
         self._logical_size = 0
+        if self._physical_size > self._reserved:
+            self._reallocate(self._reserved, 0)
+        self._head = 0
+
+    def _resize(self, front: bool = False) -> None:
+        # Called when the end being written to is full. If at least half the buffer is free the items
+        # are recentred in place, otherwise the buffer grows by the growth factor. Either way the full end
+        # gains room proportional to the logical size, so append and append_front are amortized O(1).
+        free = self._physical_size - self._logical_size
+        if free > 0 and free * 2 >= self._physical_size:
+            head = (free + 1) // 2 if front else free // 2
+            self._items[head:head + self._logical_size] = self._live()
+            self._head = head
+            return
+        physical_size = self._grown_size()
+        head = (physical_size - self._logical_size + 1) // 2 if front else self._head
+        self._reallocate(physical_size, head)
+
+    def _grown_size(self) -> int:
+        return max(self._physical_size + 1, int(self._physical_size * self._growth_factor))
+
+    def _shrink(self) -> None:
+        if self._logical_size < self._physical_size * self._shrink_threshold:
+            physical_size = max(math.ceil(self._logical_size * self._growth_factor), self._reserved)
+            if physical_size < self._physical_size:
+                self._reallocate(physical_size, (physical_size - self._logical_size) // 2)
+
+    def reserve(self, capacity: int) -> None:
+        """ Makes room for capacity items and keeps at least that capacity until shrink_to_fit() is called. """
+        if capacity < 0:
+            raise ValueError('capacity must be non-negative')
+        self._reserved = capacity
+        if self._physical_size - self._head < capacity:
+            self._reallocate(max(capacity, self._logical_size), 0)
+
+    def shrink_to_fit(self) -> None:
+        """ Releases all unused capacity, including any capacity set by reserve(). """
+        self._reserved = 0
+        if self._physical_size != self._logical_size:
+            self._reallocate(self._logical_size, 0)
 
-    def _resize(self) -> None:
-        self._physical_size *= 2
-        new_items = np.empty(self._physical_size, dtype=self._data_type)
-        new_items[:self._logical_size] = self._items
+    @property
+    def capacity(self) -> int:
+        return self._physical_size
+
+    def _reallocate(self, physical_size: int, head: int) -> None:
+        if self._mmap_path is not None:
+            self._remap(max(1, physical_size), head)
+            return
+        new_items = np.empty(physical_size, dtype=self._dtype)
+        new_items[head:head + self._logical_size] = self._live()
         self._items = new_items
+        self._head = head
+        self._physical_size = physical_size
+
+    def _remap(self, physical_size: int, head: int) -> None:
+        # The file is grown before the items move and truncated after, so the live items are always mapped.
+        # Views are detached first because shrinking the file invalidates the old mapping.
+        self._prepare_write()
+        dtype = self._items.dtype
+        if physical_size > self._physical_size:
+            self._map_file(physical_size)
+        self._items[head:head + self._logical_size] = self._live()
+        self._head = head
+        if physical_size < self._physical_size:
+            self._map_file(physical_size)
+        _write_mmap_header(self._mmap_path, dtype, self._head, self._logical_size)
+
+    def _map_file(self, physical_size: int) -> None:
+        dtype = self._items.dtype
+        self._items.flush()
+        self._items = np.empty(0, dtype=dtype)
+        with open(self._mmap_path, 'r+b') as file:
+            file.truncate(_MMAP_OFFSET + physical_size * dtype.itemsize)
+        self._items = np.memmap(self._mmap_path, dtype=dtype, mode='r+', offset=_MMAP_OFFSET, shape=(physical_size,))
+        self._physical_size = physical_size
 
     def __str__(self) -> str:
-        return '[' + ', '.join(str(item) for item in self._items[:self._logical_size]) + ']'
+        return '[' + ', '.join(str(item) for item in self._live()) + ']'
     
     def __repr__(self) -> str:
-        return f'Array {self.__str__()}, Logical: {self._logical_size}, Physical: {len(self._items)}, type: {self._data_type}'
+        return f'{type(self).__name__} {self.__str__()}, Logical: {self._logical_size}, Physical: {len(self._items)}, type: {self._data_type}'
+
+class ArrayView(Array[T]):
+    """ A slice of an Array that shares the parent's buffer instead of copying it. The view is a snapshot:
+        the first in-place write to either the parent or the view gives the view its own copy of the items.
+    """
+
+    def __init__(self, parent: Array[T], index: slice) -> None:
+        self._init_like(parent, parent._live()[index], parent._sorted and (index.step is None or index.step > 0))
+        self._shared: bool = True
+        parent._register_view(self)
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = super().__getstate__()
+        state['_items'] = self._items.copy()
+        state['_shared'] = False
+        return state
+
+    def _detach(self) -> None:
+        if self._shared:
+            # Views sliced from this view share the same buffer, so they are detached along with it.
+            self._shared = False
+            self._detach_views()
+            self._items = self._items.copy()
+
+    def _prepare_write(self) -> None:
+        self._detach()
+        super()._prepare_write()
+
 
 if __name__ == '__main__':
     filename = os.path.basename(__file__)
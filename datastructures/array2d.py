@@ -1,6 +1,8 @@
 from __future__ import annotations
 import os
-from typing import Iterator, Sequence, TypeVar
+from typing import Any, Callable, Iterator, Optional, Sequence, TypeVar
+import numpy as np
+from numpy.typing import NDArray
 
 from datastructures.iarray import IArray
 from datastructures.array import Array
@@ -11,22 +13,26 @@ T = TypeVar('T')
 class Array2D(IArray2D[T]):
 
     class Row(IArray2D.IRow[T]):
-        def __init__(self, row_index: int, array: IArray, num_columns: int) -> None:
+        def __init__(self, row_index: int, array: IArray | NDArray, num_columns: int,
+                     check_type: Optional[Callable[[Any], None]] = None) -> None:
             self.row_index = row_index
             self.array = array
             self.num_columns = num_columns
+            self.check_type = check_type
 
         def __getitem__(self, column_index: int) -> T:
-            return self.array[self.row_index][column_index]
+            return self.array[column_index]
         
         def __setitem__(self, column_index: int, value: T) -> None:
-            self.array[self.row_index][column_index] = value
+            if self.check_type is not None:
+                self.check_type(value)
+            self.array[column_index] = value
         
         def __iter__(self) -> Iterator[T]:
-            return iter(self.array[self.row_index])
+            return iter(self.array)
         
         def __reversed__(self) -> Iterator[T]:
-            return reversed(self.array[self.row_index])
+            return reversed(self.array)
 
         def __len__(self) -> int:
             return self.num_columns
@@ -39,25 +45,98 @@ class Array2D(IArray2D[T]):
 
 
     def __init__(self, starting_sequence: Sequence[Sequence[T]]=[[]], data_type=object) -> None:
-        self._data = [list(row) for row in starting_sequence]
-        self.__num_rows = len(self._data)
-        self.__num_columns = len(self._data[0]) if self.__num_rows > 0 else 0
+        self._data_type = data_type
+        # An empty Array of the element type validates single values the same way Array.__setitem__ does.
+        self._element = Array([], data_type)
+        dtype = self._element.dtype
+
+        if isinstance(starting_sequence, np.ndarray) and starting_sequence.ndim == 2:
+            try:
+                items = Array(starting_sequence.ravel(), data_type).to_numpy(copy=False)
+            except TypeError:
+                raise ValueError('All items must be of the same type') from None
+            self._items: NDArray = items.reshape(starting_sequence.shape)
+        else:
+            if not isinstance(starting_sequence, Sequence) or isinstance(starting_sequence, str) or \
+                    not all(isinstance(row, (Sequence, np.ndarray)) and not isinstance(row, str) for row in starting_sequence):
+                raise ValueError('starting_sequence must be a sequence of sequences')
+            if len({len(row) for row in starting_sequence}) > 1:
+                raise ValueError('starting_sequence must be a sequence of sequences with the same length')
+
+            num_columns = len(starting_sequence[0]) if len(starting_sequence) > 0 else 0
+            self._items = np.empty((len(starting_sequence), num_columns), dtype=dtype)
+            for row_index, row in enumerate(starting_sequence):
+                try:
+                    self._items[row_index] = Array(row, data_type).to_numpy(copy=False)
+                except TypeError:
+                    raise ValueError('All items must be of the same type') from None
+
+        self.__num_rows, self.__num_columns = self._items.shape
+        self._build_rows()
+
+    def _build_rows(self) -> None:
+        # Rows are created once and wrap zero-copy views of the buffer, so grid[r][c] allocates nothing.
+        self._rows = [Array2D.Row(row_index, self._items[row_index], self.__num_columns, self._check_type)
+                      for row_index in range(self.__num_rows)]
+
+    def _check_type(self, value: Any) -> None:
+        if np.ndim(value) == 0:
+            self._element._check_type(value)
+        else:
+            Array(np.ravel(value), self._data_type)
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state['_rows']
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._build_rows()
 
     @staticmethod
     def empty(rows: int=0, cols: int=0, data_type: type=object) -> Array2D:
-        return Array2D([[data_type() for _ in range(cols)] for _ in range(rows)], data_type)
+        dtype = Array([], data_type).dtype
+        if dtype == object:
+            return Array2D([[data_type() for _ in range(cols)] for _ in range(rows)], data_type)
+        return Array2D(np.zeros((rows, cols), dtype=dtype), data_type)
 
-    def __getitem__(self, row_index: int) -> Array2D.Row[T]: 
-        return Array2D.Row(row_index, self._data, self.__num_columns)
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.__num_rows, self.__num_columns
+
+    def to_numpy(self, copy: bool=True) -> NDArray:
+        return self._items.copy() if copy else self._items
+
+    # Rows and columns are zero-copy views wrapped in a Row, so writes through them are type-checked too.
+    def row(self, row_index: int) -> Array2D.Row[T]:
+        return self._rows[row_index]
+
+    def column(self, column_index: int) -> Array2D.Row[T]:
+        return Array2D.Row(column_index, self._items[:, column_index], self.__num_rows, self._check_type)
+
+    def __getitem__(self, index: int | tuple[int, int]) -> Array2D.Row[T] | T: 
+        if isinstance(index, tuple):
+            return self._items[index]
+        return self._rows[index]
+
+    def __setitem__(self, index: tuple[int, int], value: T) -> None:
+        self._check_type(value)
+        self._items[index] = value
     
     def __iter__(self) -> Iterator[Sequence[T]]: 
-        return iter(self._data)
+        return iter(self._rows)
     
     def __reversed__(self) -> Iterator[Sequence[T]]:
-        return reversed(self._data)
+        return reversed(self._rows)
     
     def __len__(self) -> int: 
         return self.__num_rows
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Array2D):
+            return NotImplemented
+        return self.shape == other.shape and bool(np.array_equal(self._items, other._items))
     
     def __str__(self) -> str: 
         return f'[{", ".join(f"{str(row)}" for row in self)}]'
@@ -0,0 +1,333 @@
+import abc
+import functools
+import time
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, Optional
+
+from datastructures.hashmap import HashMap, _MISSING
+from datastructures.ihashmap import KT, VT
+from datastructures.linkedlist import LinkedList
+
+
+class _Entry:
+    """A cached value with its weight and its handle in the policy's LinkedList."""
+    def __init__(self, key, value, weight: int):
+        self.key = key
+        self.value = value
+        self.weight = weight
+        self.node: Optional[LinkedList.Node] = None
+        self.expires = 0.0  # Monotonic deadline, used by TTLCache
+        self.bucket: Optional[LinkedList.Node] = None  # Frequency bucket handle, used by LFUCache
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class Cache(Generic[KT, VT], abc.ABC):
+    """A bounded cache: a HashMap from key to an entry that holds its node handle in a policy-specific LinkedList.
+
+    maxsize bounds the total weight of the entries. Without a weigher every entry weighs 1, so maxsize is the
+    number of entries. get and put are O(1); once the weight would exceed maxsize the policy evicts entries."""
+    def __init__(self, maxsize: int = 128, weigher: Optional[Callable[[KT, VT], int]] = None) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.weigher = weigher
+        self.weight = 0
+        self.stats = CacheStats()
+        self._entries: HashMap[KT, _Entry] = HashMap()
+
+    @abc.abstractmethod
+    def _insert(self, entry: _Entry) -> None:
+        """Link a new entry into the policy's order."""
+        ...
+
+    @abc.abstractmethod
+    def _touch(self, entry: _Entry) -> None:
+        """Record a hit on an entry."""
+        ...
+
+    @abc.abstractmethod
+    def _remove(self, entry: _Entry) -> None:
+        """Unlink an entry from the policy's order."""
+        ...
+
+    @abc.abstractmethod
+    def _victim(self, keep: Optional[_Entry] = None) -> _Entry:
+        """Unlink and return the entry the policy evicts next, passing over keep."""
+        ...
+
+    @abc.abstractmethod
+    def _clear_order(self) -> None:
+        ...
+
+    def _refresh(self, entry: _Entry) -> None:
+        """Record an overwrite of an entry."""
+        self._touch(entry)
+
+    def _lookup(self, key) -> Optional[_Entry]:
+        return self._entries.get(key)
+
+    def _weigh(self, key, value) -> int:
+        weight = 1 if self.weigher is None else self.weigher(key, value)
+        if weight > self.maxsize:
+            raise ValueError(f"Value for key '{key}' weighs {weight}, more than the cache's maxsize {self.maxsize}")
+        return weight
+
+    def _discard(self, entry: _Entry) -> None:
+        self._remove(entry)
+        self._entries.pop(entry.key)
+        self.weight -= entry.weight
+
+    def _evict(self, keep: Optional[_Entry] = None) -> None:
+        entry = self._victim(keep)
+        self._entries.pop(entry.key)
+        self.weight -= entry.weight
+        self.stats.evictions += 1
+
+    def get(self, key, default=None):
+        """Return the cached value for the key, or default on a miss."""
+        entry = self._lookup(key)
+        if entry is None:
+            self.stats.misses += 1
+            return default
+        self.stats.hits += 1
+        self._touch(entry)
+        return entry.value
+
+    def put(self, key, value) -> None:
+        """Cache the value for the key, evicting entries until the total weight fits in maxsize."""
+        weight = self._weigh(key, value)
+        entry = self._lookup(key)
+        if entry is not None:
+            self.weight += weight - entry.weight
+            entry.value, entry.weight = value, weight
+            self._refresh(entry)
+            while self.weight > self.maxsize:
+                self._evict(keep=entry)  # Never evict the entry being written
+            return
+        while self.weight + weight > self.maxsize:
+            self._evict()
+        self.weight += weight
+        entry = _Entry(key, value, weight)
+        self._insert(entry)
+        self._entries[key] = entry
+
+    def pop(self, key, default=_MISSING):
+        """Remove the key and return its value, or default if it is not cached."""
+        entry = self._lookup(key)
+        if entry is None:
+            if default is _MISSING:
+                raise KeyError(f"Key '{key}' not found")
+            return default
+        self._discard(entry)
+        return entry.value
+
+    def clear(self) -> None:
+        """Remove every entry. The statistics are kept."""
+        self._entries = HashMap()
+        self._clear_order()
+        self.weight = 0
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(f"Key '{key}' not found")
+        return value
+
+    def __setitem__(self, key, value) -> None:
+        self.put(key, value)
+
+    def __delitem__(self, key) -> None:
+        self.pop(key)
+
+    def __contains__(self, key) -> bool:
+        """Check whether the key is cached, without counting a hit or miss."""
+        return self._lookup(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(maxsize={self.maxsize}, weight={self.weight}, entries={len(self)})"
+
+
+class LRUCache(Cache[KT, VT]):
+    """Evicts the least recently used entry. Entries are kept in a LinkedList from most to least recent."""
+    def __init__(self, maxsize: int = 128, weigher: Optional[Callable[[KT, VT], int]] = None) -> None:
+        super().__init__(maxsize, weigher)
+        self._order: LinkedList[_Entry] = LinkedList()
+
+    def _insert(self, entry: _Entry) -> None:
+        entry.node = self._order.prepend(entry)
+
+    def _touch(self, entry: _Entry) -> None:
+        self._order.move_to_front(entry.node)
+
+    def _remove(self, entry: _Entry) -> None:
+        self._order.unlink(entry.node)
+
+    def _victim(self, keep: Optional[_Entry] = None) -> _Entry:
+        node = self._order.tail
+        if node.data is keep:
+            node = node.previous
+        return self._order.unlink(node)
+
+    def _clear_order(self) -> None:
+        self._order.clear()
+
+
+class TTLCache(LRUCache[KT, VT]):
+    """Expires entries ttl seconds after they were last written and evicts the soonest to expire when full.
+
+    Every entry lives for the same ttl, so write order is expiry order: the back of the LinkedList always
+    holds the next entry to expire, and expired entries are dropped in O(1) each."""
+    def __init__(self, maxsize: int = 128, ttl: float = 600.0, weigher: Optional[Callable[[KT, VT], int]] = None,
+                 timer: Callable[[], float] = time.monotonic) -> None:
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        super().__init__(maxsize, weigher)
+        self.ttl = ttl
+        self.timer = timer
+
+    def expire(self) -> None:
+        """Drop every entry whose ttl has passed."""
+        now = self.timer()
+        while self._order.tail and self._order.tail.data.expires <= now:
+            self._discard(self._order.tail.data)
+            self.stats.expirations += 1
+
+    def _lookup(self, key) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires <= self.timer():
+            self._discard(entry)
+            self.stats.expirations += 1
+            return None
+        return entry
+
+    def _insert(self, entry: _Entry) -> None:
+        entry.expires = self.timer() + self.ttl
+        super()._insert(entry)
+
+    def _touch(self, entry: _Entry) -> None:
+        pass  # Reads do not extend an entry's life
+
+    def _refresh(self, entry: _Entry) -> None:
+        entry.expires = self.timer() + self.ttl
+        self._order.move_to_front(entry.node)
+
+    def put(self, key, value) -> None:
+        self.expire()
+        super().put(key, value)
+
+
+class _FrequencyBucket:
+    """The entries accessed exactly frequency times, from most to least recently used."""
+    def __init__(self, frequency: int):
+        self.frequency = frequency
+        self.entries: LinkedList[_Entry] = LinkedList()
+
+
+class LFUCache(Cache[KT, VT]):
+    """Evicts the least frequently used entry, breaking ties by least recent use.
+
+    Frequency buckets form a LinkedList in increasing frequency and each entry holds its bucket's handle,
+    so a hit moves the entry to the next bucket and eviction takes the back of the first bucket, both O(1)."""
+    def __init__(self, maxsize: int = 128, weigher: Optional[Callable[[KT, VT], int]] = None) -> None:
+        super().__init__(maxsize, weigher)
+        self._buckets: LinkedList[_FrequencyBucket] = LinkedList()
+
+    def frequency(self, key) -> int:
+        """Return how many times the key has been read or written since it was cached, or 0 if it is not."""
+        entry = self._lookup(key)
+        return 0 if entry is None else entry.bucket.data.frequency
+
+    def _enter(self, entry: _Entry, bucket: LinkedList.Node) -> None:
+        entry.bucket = bucket
+        entry.node = bucket.data.entries.prepend(entry)
+
+    def _leave(self, entry: _Entry) -> None:
+        bucket = entry.bucket
+        bucket.data.entries.unlink(entry.node)
+        if bucket.data.entries.empty:
+            self._buckets.unlink(bucket)
+
+    def _insert(self, entry: _Entry) -> None:
+        first = self._buckets.head
+        if first is None or first.data.frequency != 1:
+            first = self._buckets.prepend(_FrequencyBucket(1))
+        self._enter(entry, first)
+
+    def _touch(self, entry: _Entry) -> None:
+        bucket = entry.bucket
+        frequency = bucket.data.frequency + 1
+        following = bucket.next
+        if following is None or following.data.frequency != frequency:
+            following = self._buckets.insert_after_node(bucket, _FrequencyBucket(frequency))
+        self._leave(entry)
+        self._enter(entry, following)
+
+    def _remove(self, entry: _Entry) -> None:
+        self._leave(entry)
+
+    def _victim(self, keep: Optional[_Entry] = None) -> _Entry:
+        bucket = self._buckets.head
+        node = bucket.data.entries.tail
+        if node.data is keep:
+            node = node.previous
+            if node is None:  # keep is alone in the least frequent bucket
+                bucket = bucket.next
+                node = bucket.data.entries.tail
+        entry = bucket.data.entries.unlink(node)
+        if bucket.data.entries.empty:
+            self._buckets.unlink(bucket)
+        return entry
+
+    def _clear_order(self) -> None:
+        self._buckets.clear()
+
+
+_KWARGS_MARK = object()  # Separates positional from keyword arguments in memoize keys
+
+
+def _make_key(*args, **kwargs) -> Hashable:
+    if not kwargs:
+        return args
+    return args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+
+
+def memoize(cache: Optional[Cache] | Callable = None, *, maxsize: int = 128, key: Optional[Callable[..., Hashable]] = None):
+    """Cache a function's results in a bounded cache, an LRUCache of maxsize entries unless one is given.
+
+    Usable bare (@memoize) or with arguments (@memoize(TTLCache(ttl=60))). key builds the cache key from the
+    call's arguments. The cache is exposed as the wrapper's cache attribute. It is not thread-safe."""
+    function = None
+    if callable(cache) and not isinstance(cache, Cache):
+        function, cache = cache, None
+
+    def decorator(function: Callable) -> Callable:
+        memo = cache if cache is not None else LRUCache(maxsize)
+        make_key = key or _make_key
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            cache_key = make_key(*args, **kwargs)
+            value = memo.get(cache_key, _MISSING)
+            if value is _MISSING:
+                value = function(*args, **kwargs)
+                memo.put(cache_key, value)
+            return value
+        wrapper.cache = memo
+        return wrapper
+
+    return decorator(function) if function is not None else decorator
@@ -0,0 +1,189 @@
+import math
+import threading
+from typing import Callable, Iterator, Optional, Tuple
+
+from datastructures.hashmap import HashMap, HashMapStats, Node, _MISSING
+from datastructures.ihashmap import KT, VT
+
+class ConcurrentHashMap(HashMap[KT, VT]):
+    """A thread-safe HashMap split into independently locked segments (lock striping).
+
+    Each key belongs to one segment, a chained HashMap guarded by its own lock, so writers to different
+    segments never wait on each other and a resize only locks the segment being resized. Lookups that find
+    their key do not lock at all; a miss is confirmed under the segment's lock because a concurrent rehash or
+    removal may briefly hide the key. Iteration is weakly consistent: each segment is snapshotted under its lock."""
+    _lookup_method = '_lookup'
+
+    def __init__(self, number_of_buckets=7, load_factor=0.75, custom_hash_function: Optional[Callable[[KT], int]] = None,
+                 stable_hash: bool = False, min_load_factor: Optional[float] = None, concurrency_level: int = 16) -> None:
+        if concurrency_level < 1:
+            raise ValueError("concurrency_level must be at least 1")
+        super().__init__(number_of_buckets, load_factor, custom_hash_function, stable_hash, min_load_factor)
+        self.buckets = []
+        # Every segment starts with number_of_buckets buckets and grows or shrinks on its own.
+        self._segments = [HashMap[KT, VT](number_of_buckets, load_factor, self.custom_hash_function,
+                                          min_load_factor=self.min_load_factor) for _ in range(concurrency_level)]
+        self._locks = [threading.RLock() for _ in range(concurrency_level)]
+
+    def _segment_index(self, key_hash: int) -> int:
+        # Mix the hash before picking a segment so keys within a segment still spread over its buckets.
+        return ((key_hash * 0x9E3779B1) >> 16) % len(self._segments)
+
+    @staticmethod
+    def _peek(segment: HashMap, key, key_hash: int) -> Optional[Node]:
+        """Find the key's node without locking. Rehashing builds fresh bucket lists and removal only cuts a
+        chain short, so a node found this way was present in the segment; a concurrent write can at worst
+        hide a key, which _lookup rechecks under the lock."""
+        buckets = segment.buckets
+        handle = HashMap._chain_handle(buckets[key_hash % len(buckets)], key, key_hash)
+        return None if handle is None else handle.data
+
+    def _lookup(self, key, key_hash: int) -> Optional[Node]:
+        index = self._segment_index(key_hash)
+        node = self._peek(self._segments[index], key, key_hash)
+        if node is None:
+            with self._locks[index]:
+                node = self._peek(self._segments[index], key, key_hash)
+        return node
+
+    def __getitem__(self, key):
+        """Retrieve the value associated with the key."""
+        node = self._lookup(key, self.custom_hash_function(key))
+        if node is None:
+            raise KeyError(f"Key '{key}' not found")
+        return node.value
+
+    def get(self, key, default=None):
+        """Return the value for the key, or default if it is not in the hashmap."""
+        node = self._lookup(key, self.custom_hash_function(key))
+        return default if node is None else node.value
+
+    def __contains__(self, key) -> bool:
+        """Check whether the hashmap contains a specific key."""
+        return self._lookup(key, self.custom_hash_function(key)) is not None
+
+    def _store(self, key, key_hash: int, value) -> None:
+        index = self._segment_index(key_hash)
+        with self._locks[index]:
+            self._segments[index]._store(key, key_hash, value)
+
+    def setdefault(self, key, default=None):
+        """Atomically return the value for the key, inserting default first if the key is absent."""
+        return self.compute_if_absent(key, lambda _: default)
+
+    def compute_if_absent(self, key, factory: Callable[[KT], VT]) -> VT:
+        """Return the value for the key, atomically inserting factory(key) first if the key is absent.
+
+        factory runs while the key's segment is locked, so it is called at most once per missing key."""
+        key_hash = self.custom_hash_function(key)
+        index = self._segment_index(key_hash)
+        segment = self._segments[index]
+        node = self._peek(segment, key, key_hash)
+        if node is not None:
+            return node.value
+        with self._locks[index]:
+            node = self._peek(segment, key, key_hash)
+            if node is not None:
+                return node.value
+            value = factory(key)
+            segment._store(key, key_hash, value)
+            return value
+
+    def merge(self, key, value: VT, function: Callable[[VT, VT], Optional[VT]]) -> Optional[VT]:
+        """Atomically store value for an absent key, or function(old, value) for a present one.
+
+        If function returns None the key is removed. Returns the new value, or None if the key was removed."""
+        key_hash = self.custom_hash_function(key)
+        index = self._segment_index(key_hash)
+        segment = self._segments[index]
+        with self._locks[index]:
+            node = self._peek(segment, key, key_hash)
+            if node is None:
+                segment._store(key, key_hash, value)
+                return value
+            merged = function(node.value, value)
+            if merged is None:
+                self._remove(segment, key, key_hash)
+            else:
+                node.value = merged
+            return merged
+
+    def _remove(self, segment: HashMap, key, key_hash: int) -> Optional[Node]:
+        """Unlink the key's node from a segment whose lock is held."""
+        bucket, handle = segment._locate(key, key_hash)
+        if handle is None:
+            return None
+        node = bucket.unlink(handle)
+        segment.size -= 1
+        segment._shrink()
+        return node
+
+    def pop(self, key, default=_MISSING):
+        """Remove the key and return its value, or default if it is not in the hashmap."""
+        key_hash = self.custom_hash_function(key)
+        index = self._segment_index(key_hash)
+        with self._locks[index]:
+            node = self._remove(self._segments[index], key, key_hash)
+        if node is None:
+            if default is _MISSING:
+                raise KeyError(f"Key '{key}' not found")
+            return default
+        return node.value
+
+    def reserve(self, expected_size: int) -> None:
+        """Grow every segment once so that expected_size evenly spread entries fit without further resizes."""
+        per_segment = math.ceil(expected_size / len(self._segments))
+        for lock, segment in zip(self._locks, self._segments):
+            with lock:
+                segment.reserve(per_segment)
+
+    def compact(self) -> None:
+        """Compact every segment, locking one segment at a time."""
+        for lock, segment in zip(self._locks, self._segments):
+            with lock:
+                segment.compact()
+
+    def stats(self) -> HashMapStats:
+        """Combine the statistics of every segment with this hashmap's own hash timing and slow operations."""
+        segments = []
+        for lock, segment in zip(self._locks, self._segments):
+            with lock:
+                segments.append(segment.stats())
+        histogram: dict[int, int] = {}
+        for segment_stats in segments:
+            for length, count in segment_stats.chain_lengths.items():
+                histogram[length] = histogram.get(length, 0) + count
+        number_of_buckets = sum(segment_stats.number_of_buckets for segment_stats in segments)
+        return HashMapStats(len(self), number_of_buckets, len(self) / number_of_buckets, dict(sorted(histogram.items())),
+                            max(histogram, default=0), sum(segment_stats.resizes for segment_stats in segments),
+                            sum(segment_stats.resize_time for segment_stats in segments), self._hash_time,
+                            list(self.slow_operations or ()))
+
+    def _snapshot(self) -> Iterator[Node]:
+        for lock, segment in zip(self._locks, self._segments):
+            with lock:
+                nodes = list(segment._nodes())
+            yield from nodes
+
+    def keys(self) -> Iterator:
+        """Return an iterator over the keys in the hashmap."""
+        for node in self._snapshot():
+            yield node.key
+
+    def values(self) -> Iterator:
+        """Return an iterator over the values in the hashmap."""
+        for node in self._snapshot():
+            yield node.value
+
+    def items(self) -> Iterator[Tuple]:
+        """Return an iterator over the key-value pairs in the hashmap."""
+        for node in self._snapshot():
+            yield (node.key, node.value)
+
+    def __len__(self) -> int:
+        """Return the number of key-value pairs in the hashmap."""
+        return sum(segment.size for segment in self._segments)
+
+    def __repr__(self) -> str:
+        """Return a developer-friendly representation of the hashmap."""
+        return f"ConcurrentHashMap({str(self)})"
@@ -0,0 +1,229 @@
+import io
+import os
+import pickle
+import struct
+import threading
+import zlib
+from typing import BinaryIO, Iterator, Optional, Tuple
+
+from datastructures.hashmap import HashMap
+from datastructures.ihashmap import IHashMap, KT, VT
+
+# Every record is a header (CRC32 of everything after it, key length, value length, flags) followed by the
+# pickled key and value. A delete is a record with the _DELETE flag and no value.
+_RECORD = struct.Struct('<IIIB')
+_DELETE = 1
+
+
+def _record(key_bytes: bytes, value_bytes: bytes, flags: int) -> bytes:
+    body = _RECORD.pack(0, len(key_bytes), len(value_bytes), flags)[4:] + key_bytes + value_bytes
+    return struct.pack('<I', zlib.crc32(body)) + body
+
+
+def _scan(file: BinaryIO, start: int = 0) -> Iterator[Tuple[int, int, object, int, int]]:
+    """Yield (offset, flags, key, key length, value length) for each intact record from start, stopping at
+    the first torn or corrupt one."""
+    offset = start
+    file.seek(start)
+    while True:
+        header = file.read(_RECORD.size)
+        if len(header) < _RECORD.size:
+            return
+        crc, key_length, value_length, flags = _RECORD.unpack(header)
+        payload = file.read(key_length + value_length)
+        if len(payload) < key_length + value_length or zlib.crc32(header[4:] + payload) != crc:
+            return
+        yield offset, flags, pickle.loads(payload[:key_length]), key_length, value_length
+        offset += _RECORD.size + key_length + value_length
+
+
+class DiskHashMap(IHashMap[KT, VT]):
+    """A persistent hashmap: entries are appended to a log file and an in-memory HashMap maps each key to the
+    offset of its latest record, so a lookup is one seek and read.
+
+    Reopening rebuilds the index by scanning the log. Every record carries a CRC, so a write torn by a crash
+    is detected and truncated away. Overwrites and deletes leave dead records behind; compact() rewrites the
+    log with only the live ones, optionally on a background thread while reads and writes continue.
+    Set sync to fsync after every write instead of only flushing to the operating system."""
+    def __init__(self, path: str | os.PathLike, sync: bool = False) -> None:
+        self.path = os.fspath(path)
+        self.sync = sync
+        self._lock = threading.RLock()
+        self._index: HashMap[KT, Tuple[int, int, int]] = HashMap()
+        self._live_bytes = 0
+        self._compaction: Optional[threading.Thread] = None
+        self._file = open(self.path, 'a+b')
+        self._end = self._load(self._file, 0, self._index)
+        if self._end < os.path.getsize(self.path):
+            self._file.truncate(self._end)  # Drop the torn tail of an interrupted write
+
+    def _load(self, file: BinaryIO, start: int, index: HashMap, base: int = 0) -> int:
+        """Replay the records of file from start into index, rebasing their offsets by base. Returns the
+        offset just past the last intact record."""
+        end = start
+        for offset, flags, key, key_length, value_length in _scan(file, start):
+            size = _RECORD.size + key_length + value_length
+            old = index.pop(key, None)
+            if old is not None:
+                self._live_bytes -= _RECORD.size + old[1] + old[2]
+            if not flags & _DELETE:
+                index[key] = (offset + base, key_length, value_length)
+                self._live_bytes += size
+            end = offset + size
+        return end
+
+    def _append(self, record: bytes) -> int:
+        offset = self._end
+        self._file.write(record)
+        self._file.flush()
+        if self.sync:
+            os.fsync(self._file.fileno())
+        self._end += len(record)
+        return offset
+
+    def _read_value(self, location: Tuple[int, int, int]):
+        offset, key_length, value_length = location
+        self._file.seek(offset + _RECORD.size + key_length)
+        return pickle.loads(self._file.read(value_length))
+
+    def __getitem__(self, key: KT) -> VT:
+        with self._lock:
+            location = self._index.get(key)
+            if location is None:
+                raise KeyError(f"Key '{key}' not found")
+            return self._read_value(location)
+
+    def get(self, key: KT, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key: KT, value: VT) -> None:
+        key_bytes, value_bytes = pickle.dumps(key), pickle.dumps(value)
+        with self._lock:
+            offset = self._append(_record(key_bytes, value_bytes, 0))
+            old = self._index.get(key)
+            if old is not None:
+                self._live_bytes -= _RECORD.size + old[1] + old[2]
+            self._index[key] = (offset, len(key_bytes), len(value_bytes))
+            self._live_bytes += _RECORD.size + len(key_bytes) + len(value_bytes)
+
+    def __delitem__(self, key: KT) -> None:
+        with self._lock:
+            old = self._index.pop(key, None)
+            if old is None:
+                raise KeyError(f"Key '{key}' not found")
+            self._append(_record(pickle.dumps(key), b'', _DELETE))
+            self._live_bytes -= _RECORD.size + old[1] + old[2]
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def keys(self) -> Iterator:
+        """Return an iterator over a snapshot of the keys in the hashmap."""
+        with self._lock:
+            keys = list(self._index.keys())
+        return iter(keys)
+
+    def values(self) -> Iterator:
+        """Return an iterator over the values of the keys present when iteration started."""
+        for _, value in self.items():
+            yield value
+
+    def items(self) -> Iterator[Tuple]:
+        """Return an iterator over the key-value pairs of the keys present when iteration started."""
+        for key in self.keys():
+            with self._lock:
+                location = self._index.get(key)
+                if location is None:
+                    continue
+                value = self._read_value(location)
+            yield (key, value)
+
+    def __iter__(self) -> Iterator:
+        return self.keys()
+
+    @property
+    def garbage_ratio(self) -> float:
+        """The fraction of the log taken up by overwritten or deleted records."""
+        return 1 - self._live_bytes / self._end if self._end else 0.0
+
+    def compact(self, background: bool = False) -> Optional[threading.Thread]:
+        """Rewrite the log with only the live records and atomically replace the old file.
+
+        With background=True the copy runs on a thread, which is returned, while the hashmap stays usable;
+        writes made during the copy are replayed onto the new log before the switch. Does nothing if a
+        background compaction is already running."""
+        if self._compaction is not None and self._compaction.is_alive():
+            return self._compaction
+        if not background:
+            self._compact()
+            return None
+        self._compaction = threading.Thread(target=self._compact, name=f'compact {self.path}', daemon=True)
+        self._compaction.start()
+        return self._compaction
+
+    def _compact(self) -> None:
+        with self._lock:
+            snapshot = list(self._index.items())
+            snapshot_end = self._end
+        temporary_path = self.path + '.compact'
+        index: HashMap[KT, Tuple[int, int, int]] = HashMap()
+        position = 0
+        with open(self.path, 'rb') as source, open(temporary_path, 'wb') as target:
+            # Records before snapshot_end never change, so they can be copied without holding the lock.
+            for key, (offset, key_length, value_length) in snapshot:
+                source.seek(offset)
+                target.write(source.read(_RECORD.size + key_length + value_length))
+                index[key] = (position, key_length, value_length)
+                position += _RECORD.size + key_length + value_length
+            with self._lock:
+                source.seek(snapshot_end)
+                tail = source.read(self._end - snapshot_end)
+                target.write(tail)
+                target.flush()
+                os.fsync(target.fileno())
+                self._live_bytes = position
+                self._load(io.BytesIO(tail), 0, index, base=position)
+                self._file.close()
+                os.replace(temporary_path, self.path)
+                self._file = open(self.path, 'a+b')
+                self._index = index
+                self._end = position + len(tail)
+
+    def flush(self) -> None:
+        """Flush and fsync the log."""
+        with self._lock:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """Wait for a running compaction, then flush and close the log."""
+        if self._compaction is not None:
+            self._compaction.join()
+        with self._lock:
+            if not self._file.closed:
+                self.flush()
+                self._file.close()
+
+    def __enter__(self) -> 'DiskHashMap[KT, VT]':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IHashMap):
+            return False
+        return dict(self.items()) == dict(other.items())
+
+    def __str__(self) -> str:
+        return "{" + ", ".join(f"{key}: {value}" for key, value in self.items()) + "}"
+
+    def __repr__(self) -> str:
+        return f"DiskHashMap({self.path!r}, {len(self)} entries)"
@@ -1,33 +1,97 @@
 import copy
-from typing import Callable, Iterator, Optional, Tuple
+import math
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator, Mapping, Optional, Tuple
 import pickle
 import hashlib
 
+from datastructures.ihashmap import IHashMap, KT, VT
 from datastructures.linkedlist import LinkedList
 
-from typing import Generic, TypeVar
-
-KT = TypeVar("KT")  # Key type
-VT = TypeVar("VT")  # Value type
+_MISSING = object()  # Default for pop so that None can be passed as an explicit default
 
 class Node:
     """A node to store key-value pairs in the linked list."""
-    def __init__(self, key, value):
+    def __init__(self, key, value, hash: int):
         self.key = key
         self.value = value
+        self.hash = hash  # Full hash of the key, cached so resizing never rehashes
         self.next = None  # Maintain chaining in LinkedList
 
-class HashMap(Generic[KT, VT]):
-    def __init__(self, number_of_buckets=7, load_factor=0.75, custom_hash_function: Optional[Callable[[int], int]] = None) -> None:
+@dataclass
+class SlowOperation:
+    operation: str
+    key: object
+    seconds: float
+
+@dataclass
+class HashMapStats:
+    size: int
+    number_of_buckets: int
+    load_factor: float
+    chain_lengths: dict[int, int]  # Chain (or probe) length -> how many buckets (or entries) have it
+    max_chain_length: int
+    resizes: int
+    resize_time: float
+    hash_time: float  # Only measured while the hashmap is instrumented
+    slow_operations: list[SlowOperation] = field(default_factory=list)
+
+class HashMap(IHashMap[KT, VT]):
+    _lookup_method = '_locate'  # The (key, key_hash) lookup that instrument() samples
+
+    def __init__(self, number_of_buckets=7, load_factor=0.75, custom_hash_function: Optional[Callable[[KT], int]] = None,
+                 stable_hash: bool = False, min_load_factor: Optional[float] = None,
+                 incremental_resize: bool = False, rehash_batch: int = 4) -> None:
+        if min_load_factor is None:
+            min_load_factor = load_factor / 4
+        # Growing leaves the table at load_factor / 2 and shrinking targets the same load, so the shrink
+        # threshold must stay below it or a single insert/delete pair could resize back and forth.
+        if not 0 <= min_load_factor < load_factor / 2:
+            raise ValueError("min_load_factor must be between 0 and load_factor / 2")
         self.number_of_buckets = number_of_buckets
+        self.min_number_of_buckets = number_of_buckets
         self.load_factor = load_factor
-        self.custom_hash_function = custom_hash_function or self._default_hash_function
-        self.buckets = [LinkedList() for _ in range(self.number_of_buckets)]
+        self.min_load_factor = min_load_factor
+        if custom_hash_function is None:
+            custom_hash_function = self._stable_hash_function if stable_hash else self._default_hash_function
+        self.custom_hash_function = custom_hash_function
+        # Buckets are created on first use so allocating a table is a single list allocation.
+        self.buckets: list[Optional[LinkedList]] = [None] * self.number_of_buckets
         self.size = 0
+        # In incremental mode a resize keeps the old table alongside the new one and every operation
+        # migrates up to rehash_batch of its buckets, so no single operation pays for a full rehash.
+        self.incremental_resize = incremental_resize
+        self.rehash_batch = rehash_batch
+        self._old_buckets: Optional[list[Optional[LinkedList]]] = None
+        self._rehash_index = 0
+        self.resizes = 0
+        self._resize_time = 0.0
+        self._hash_time = 0.0
+        self.slow_operations: Optional[deque[SlowOperation]] = None  # Set by instrument()
+
+    @classmethod
+    def from_items(cls, items: Mapping[KT, VT] | Iterable[Tuple[KT, VT]], expected_size: Optional[int] = None, **kwargs) -> 'HashMap[KT, VT]':
+        """Build a hashmap from a mapping or key-value pairs, sizing the bucket table once up front."""
+        hashmap = cls(**kwargs)
+        if expected_size is None and hasattr(items, '__len__'):
+            expected_size = len(items)
+        hashmap.update(items, expected_size)
+        return hashmap
 
     @staticmethod
     def _default_hash_function(key) -> int:
-        """Default hash function using MD5 for consistency."""
+        """Default hash function using the built-in hash, falling back to the stable hash for unhashable keys."""
+        try:
+            return hash(key)
+        except TypeError:
+            return HashMap._stable_hash_function(key)
+
+    @staticmethod
+    def _stable_hash_function(key) -> int:
+        """Hash function using MD5 so bucket placement is identical across processes."""
         try:
             key_bytes = pickle.dumps(key)
         except Exception:
@@ -40,71 +104,257 @@ class HashMap(Generic[KT, VT]):
 
     def _resize(self):
         """Resize the hashmap when the load factor threshold is exceeded."""
-        if self.size / self.number_of_buckets > self.load_factor:
-            old_buckets = self.buckets
-            self.number_of_buckets *= 2
-            self.buckets = [LinkedList() for _ in range(self.number_of_buckets)]
-            self.size = 0
+        if self.size / self.number_of_buckets > self.load_factor and self._old_buckets is None:
+            self._begin_rehash(self.number_of_buckets * 2)
+
+    def _shrink(self) -> None:
+        """Shrink the bucket table once the load drops below min_load_factor."""
+        if self.size / self.number_of_buckets < self.min_load_factor and self.number_of_buckets > self.min_number_of_buckets \
+                and self._old_buckets is None:
+            self._begin_rehash(self._compact_size())
 
-            for bucket in old_buckets:
+    def _begin_rehash(self, number_of_buckets: int) -> None:
+        """Start migrating to a table of number_of_buckets, or rehash at once outside incremental mode."""
+        if not self.incremental_resize:
+            self._rehash(number_of_buckets)
+            return
+        start = time.perf_counter()
+        self._old_buckets = self.buckets
+        self._rehash_index = 0
+        self.number_of_buckets = number_of_buckets
+        self.buckets = [None] * number_of_buckets
+        self._note_resize(start)
+
+    def _rehash_step(self) -> None:
+        """Move up to rehash_batch non-empty buckets (visiting at most ten times that many) into the new table."""
+        start = time.perf_counter()
+        old_buckets = self._old_buckets
+        moved = visited = 0
+        while self._rehash_index < len(old_buckets) and moved < self.rehash_batch and visited < self.rehash_batch * 10:
+            bucket = old_buckets[self._rehash_index]
+            old_buckets[self._rehash_index] = None
+            self._rehash_index += 1
+            visited += 1
+            if bucket:
                 for node in bucket:
-                    self.__setitem__(node.key, node.value)
+                    self._bucket_for(node.hash).append(node)
+                moved += 1
+        if self._rehash_index >= len(old_buckets):
+            self._old_buckets = None
+        self._resize_time += time.perf_counter() - start
+
+    def _bucket_for(self, key_hash: int) -> LinkedList:
+        """Return the bucket for the hash in the current table, creating it on first use."""
+        index = key_hash % self.number_of_buckets
+        bucket = self.buckets[index]
+        if bucket is None:
+            bucket = self.buckets[index] = LinkedList()
+        return bucket
+
+    def _finish_rehash(self) -> None:
+        """Migrate every bucket left in the old table."""
+        while self._old_buckets is not None:
+            self._rehash_step()
+
+    def _nodes(self) -> Iterator[Node]:
+        """Iterate over every node. A pending migration is finished first, because the rehash steps run by
+        lookups during iteration would otherwise move nodes behind the iterator."""
+        self._finish_rehash()
+        for bucket in self.buckets:
+            if bucket:
+                yield from bucket
+
+    def instrument(self, slow_threshold: float = 0.001, on_slow_operation: Optional[Callable[[SlowOperation], None]] = None,
+                   sample_rate: float = 1.0, max_samples: int = 100) -> None:
+        """Start timing the hash function and sampling slow operations.
+
+        A sample_rate fraction of lookups are timed; lookups and resizes slower than slow_threshold seconds
+        are kept in slow_operations (the most recent max_samples of them) and passed to on_slow_operation."""
+        if self.slow_operations is not None:
+            return
+        self.slow_operations = deque(maxlen=max_samples)
+        self._slow_threshold = slow_threshold
+        self._on_slow_operation = on_slow_operation
+        self._sampler = random.Random()  # A private generator, so sampling leaves the global random sequence alone
+        sample = self._sampler.random
+        hash_function, locate = self.custom_hash_function, getattr(self, self._lookup_method)
+
+        def timed_hash(key) -> int:
+            start = time.perf_counter()
+            key_hash = hash_function(key)
+            self._hash_time += time.perf_counter() - start
+            return key_hash
+
+        def sampled_locate(key, key_hash: int):
+            if sample() >= sample_rate:
+                return locate(key, key_hash)
+            start = time.perf_counter()
+            result = locate(key, key_hash)
+            self._note_slow('lookup', key, time.perf_counter() - start)
+            return result
+
+        self.custom_hash_function = timed_hash
+        setattr(self, self._lookup_method, sampled_locate)
+
+    def _note_slow(self, operation: str, key, seconds: float) -> None:
+        if self.slow_operations is not None and seconds >= self._slow_threshold:
+            sample = SlowOperation(operation, key, seconds)
+            self.slow_operations.append(sample)
+            if self._on_slow_operation is not None:
+                self._on_slow_operation(sample)
+
+    def _note_resize(self, start: float) -> None:
+        """Count a resize that began at perf_counter() time start."""
+        seconds = time.perf_counter() - start
+        self.resizes += 1
+        self._resize_time += seconds
+        self._note_slow('resize', None, seconds)
+
+    def _chain_lengths(self) -> Iterator[int]:
+        for buckets in (self.buckets, self._old_buckets or ()):
+            for bucket in buckets:
+                yield len(bucket) if bucket else 0
+
+    def stats(self) -> HashMapStats:
+        """Report how the entries are spread over the buckets and how much time went into hashing and resizing."""
+        histogram: dict[int, int] = {}
+        for length in self._chain_lengths():
+            histogram[length] = histogram.get(length, 0) + 1
+        return HashMapStats(len(self), self.number_of_buckets, len(self) / self.number_of_buckets,
+                            dict(sorted(histogram.items())), max(histogram, default=0), self.resizes,
+                            self._resize_time, self._hash_time, list(self.slow_operations or ()))
+
+    def _compact_size(self) -> int:
+        return max(self.min_number_of_buckets, math.floor(self.size / (self.load_factor / 2)) + 1)
+
+    def compact(self) -> None:
+        """Rehash into the smallest table that holds the current entries at half the load factor, never growing it."""
+        self._rehash(min(self.number_of_buckets, self._compact_size()))
+
+    def reserve(self, expected_size: int) -> None:
+        """Grow the bucket table once so that expected_size entries fit without further resizes."""
+        number_of_buckets = math.floor(expected_size / self.load_factor) + 1
+        if number_of_buckets > self.number_of_buckets:
+            self._rehash(number_of_buckets)
+
+    def _rehash(self, number_of_buckets: int) -> None:
+        """Redistribute the existing nodes by their cached hash, without comparing keys or resizing again."""
+        start = time.perf_counter()
+        nodes = list(self._nodes())
+        self._old_buckets = None
+        self.number_of_buckets = number_of_buckets
+        self.buckets = [None] * number_of_buckets
+        for node in nodes:
+            self._bucket_for(node.hash).append(node)
+        self._note_resize(start)
+
+    @staticmethod
+    def _chain_handle(bucket: Optional[LinkedList], key, key_hash: int) -> Optional[LinkedList.Node]:
+        current = bucket.head if bucket else None
+        while current:
+            node = current.data
+            if node.hash == key_hash and node.key == key:
+                return current
+            current = current.next
+        return None
+
+    def _locate(self, key, key_hash: int) -> Tuple[Optional[LinkedList], Optional[LinkedList.Node]]:
+        """Return the bucket holding the key and the key's handle in it, checking the old table during an
+        incremental resize. The handle lets pop unlink the node without walking the chain again."""
+        if self._old_buckets is not None:
+            self._rehash_step()
+        bucket = self.buckets[key_hash % self.number_of_buckets]
+        handle = self._chain_handle(bucket, key, key_hash)
+        if handle is None and self._old_buckets is not None:
+            bucket = self._old_buckets[key_hash % len(self._old_buckets)]
+            handle = self._chain_handle(bucket, key, key_hash)
+        return bucket, handle
+
+    def _find_node(self, key, key_hash: int) -> Optional[Node]:
+        """Return the node holding the key, or None if it is not in the hashmap."""
+        handle = self._locate(key, key_hash)[1]
+        return None if handle is None else handle.data
 
     def __getitem__(self, key):
         """Retrieve the value associated with the key."""
-        index = self._get_bucket_index(key)
-        bucket = self.buckets[index]
-        for node in bucket:
-            if node.key == key:
-                return node.value
-        raise KeyError(f"Key '{key}' not found")
+        node = self._find_node(key, self.custom_hash_function(key))
+        if node is None:
+            raise KeyError(f"Key '{key}' not found")
+        return node.value
 
     def __setitem__(self, key, value) -> None:
         """Insert or update a key-value pair in the hashmap."""
-        index = self._get_bucket_index(key)
-        bucket = self.buckets[index]
-        for node in bucket:
-            if node.key == key:
-                node.value = value
-                return
-        bucket.append(Node(key, value))  # Store as an object instead of a tuple
+        self._store(key, self.custom_hash_function(key), value)
+
+    def _store(self, key, key_hash: int, value) -> None:
+        node = self._find_node(key, key_hash)
+        if node is not None:
+            node.value = value
+            return
+        self._bucket_for(key_hash).append(Node(key, value, key_hash))  # Store as an object instead of a tuple
         self.size += 1
         self._resize()
 
+    def get(self, key, default=None):
+        """Return the value for the key, or default if it is not in the hashmap."""
+        node = self._find_node(key, self.custom_hash_function(key))
+        return default if node is None else node.value
+
+    def setdefault(self, key, default=None):
+        """Return the value for the key, inserting default first if the key is not in the hashmap."""
+        key_hash = self.custom_hash_function(key)
+        node = self._find_node(key, key_hash)
+        if node is not None:
+            return node.value
+        self._store(key, key_hash, default)
+        return default
+
+    def pop(self, key, default=_MISSING):
+        """Remove the key and return its value, or default if it is not in the hashmap."""
+        bucket, handle = self._locate(key, self.custom_hash_function(key))
+        if handle is None:
+            if default is _MISSING:
+                raise KeyError(f"Key '{key}' not found")
+            return default
+        node = bucket.unlink(handle)
+        self.size -= 1
+        self._shrink()
+        return node.value
+
+    def update(self, items: Mapping[KT, VT] | Iterable[Tuple[KT, VT]], expected_size: Optional[int] = None) -> None:
+        """Insert every key-value pair from a mapping or an iterable of pairs, reserving room for them first."""
+        if expected_size is None and hasattr(items, '__len__'):
+            expected_size = len(items)
+        if isinstance(items, Mapping):
+            items = items.items()  # May be a generator, so its length is read from the mapping above
+        if expected_size:
+            self.reserve(len(self) + expected_size)
+        hash_function, store = self.custom_hash_function, self._store
+        for key, value in items:
+            store(key, hash_function(key), value)
+
     def keys(self) -> Iterator:
         """Return an iterator over the keys in the hashmap."""
-        for bucket in self.buckets:
-            for node in bucket:
-                yield node.key
+        for node in self._nodes():
+            yield node.key
 
     def values(self) -> Iterator:
         """Return an iterator over the values in the hashmap."""
-        for bucket in self.buckets:
-            for node in bucket:
-                yield node.value
+        for node in self._nodes():
+            yield node.value
 
     def items(self) -> Iterator[Tuple]:
         """Return an iterator over the key-value pairs in the hashmap."""
-        for bucket in self.buckets:
-            for node in bucket:
-                yield (node.key, node.value)
+        for node in self._nodes():
+            yield (node.key, node.value)
 
     def __delitem__(self, key) -> None:
         """Remove a key-value pair from the hashmap."""
-        index = self._get_bucket_index(key)
-        bucket = self.buckets[index]
-        for node in bucket:
-            if node.key == key:
-                bucket.remove(node)
-                self.size -= 1
-                return
-        raise KeyError(f"Key '{key}' not found")
+        self.pop(key)
 
     def __contains__(self, key) -> bool:
         """Check whether the hashmap contains a specific key."""
-        index = self._get_bucket_index(key)
-        bucket = self.buckets[index]
-        return any(node.key == key for node in bucket)
+        return self._find_node(key, self.custom_hash_function(key)) is not None
 
     def __len__(self) -> int:
         """Return the number of key-value pairs in the hashmap."""
@@ -116,7 +366,7 @@ class HashMap(Generic[KT, VT]):
 
     def __eq__(self, other: object) -> bool:
         """Check equality between two hashmaps."""
-        if not isinstance(other, HashMap):
+        if not isinstance(other, IHashMap):
             return False
         return dict(self.items()) == dict(other.items())
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 from abc import abstractmethod
 import abc
 import os
-from typing import Sequence, TypeVar
+from typing import Callable, Iterable, Iterator, Sequence, TypeVar
 
 T = TypeVar('T')
 
@@ -14,7 +14,7 @@ class ILinkedList[T](abc.ABC):
     '''
 
     @abstractmethod
-    def __init__(self, data_type: type = object) -> None:
+    def __init__(self, data_type: type = object, validate_types: bool = True) -> None:
 
         ''' Initializes the LinkedList object with a data_type.
 
@@ -25,12 +25,13 @@ class ILinkedList[T](abc.ABC):
         
             Arguments:
                 data_type: The type of the elements in the list
+                validate_types: Whether to check every inserted item against data_type
         '''
         ...
     
     @staticmethod
     @abstractmethod
-    def from_sequence(sequence: Sequence[T], data_type: type=object) -> ILinkedList[T]:
+    def from_sequence(sequence: Sequence[T], data_type: type=object, validate_types: bool=True) -> ILinkedList[T]:
 
         ''' Creates a LinkedList object from a Python list.
 
@@ -42,6 +43,7 @@ class ILinkedList[T](abc.ABC):
             Arguments:
                 sequence: The sequence to create the LinkedList from
                 data_type: The data type of the items
+                validate_types: Whether to check every item against data_type
 
             Returns:
                 A LinkedList object
@@ -53,7 +55,7 @@ class ILinkedList[T](abc.ABC):
         ...
 
     @abstractmethod
-    def append(self, item: T) -> None:
+    def append(self, item: T) -> object:
 
         ''' Adds an item to the end of the list 
         
@@ -67,6 +69,11 @@ class ILinkedList[T](abc.ABC):
             Arguments:
                 item: The item to add to the list
 
+            Returns:
+                A handle to the node holding the item, for the implementation's O(1) node operations. The
+                handle may only be passed to the list that holds the node; a handle from another list is not
+                detected and corrupts both lists
+
             Raises:
                 TypeError: If the item is not of the correct type
             
@@ -74,7 +81,7 @@ class ILinkedList[T](abc.ABC):
         ...
 
     @abstractmethod
-    def prepend(self, item: T) -> None:
+    def prepend(self, item: T) -> object:
 
         ''' Adds an item to the beginning of the list
         
@@ -88,11 +95,58 @@ class ILinkedList[T](abc.ABC):
             Arguments:
                 item: The item to add to the list
 
+            Returns:
+                A handle to the node holding the item, for the implementation's O(1) node operations. The
+                handle may only be passed to the list that holds the node; a handle from another list is not
+                detected and corrupts both lists
+
             Raises:
                 TypeError: If the item is not of the correct type
         '''
         ...
 
+    @abstractmethod
+    def extend(self, items: Iterable[T]) -> None:
+
+        ''' Adds every item of an iterable to the end of the list
+        
+            Examples:
+                >>> linked_list = LinkedList(data_type=int)
+                >>> linked_list.extend(range(5))
+                >>> print(linked_list)
+                (0 <-> 1 <-> 2 <-> 3 <-> 4)
+                
+            Arguments:
+                items: The items to add to the list
+
+            Raises:
+                TypeError: If any item is not of the correct type, in which case the list is unchanged
+        '''
+        ...
+
+    @abstractmethod
+    def concat(self, other: ILinkedList[T]) -> None:
+
+        ''' Moves every item of another list to the end of this list, leaving the other list empty
+        
+            Examples:
+                >>> linked_list = LinkedList.from_sequence([1, 2], data_type=int)
+                >>> other = LinkedList.from_sequence([3, 4], data_type=int)
+                >>> linked_list.concat(other)
+                >>> print(linked_list)
+                (1 <-> 2 <-> 3 <-> 4)
+                >>> print(other)
+                ()
+                
+            Arguments:
+                other: The list whose items are moved. Handles to its nodes belong to this list afterwards
+
+            Raises:
+                TypeError: If the other list may hold items not of the correct type
+                ValueError: If other is this list
+        '''
+        ...
+
     @abstractmethod
     def insert_before(self, target: T, item: T) -> None:
 
@@ -163,7 +217,7 @@ class ILinkedList[T](abc.ABC):
         ...
 
     @abstractmethod
-    def remove_all(self, item: T) -> None:
+    def remove_all(self, item: T) -> int:
 
         ''' Removes all occurrences of an item from the list
         
@@ -174,17 +228,61 @@ class ILinkedList[T](abc.ABC):
                 >>> linked_list.append('mouse')
                 >>> linked_list.append('cat')
                 >>> linked_list.remove_all('cat')
+                2
                 >>> print(linked_list)
                 (dog <-> mouse)
                 
             Arguments:
                 item: The item to remove from the list
 
+            Returns:
+                The number of items removed
+
             Raises:
                 TypeError: If the item is not of the correct type
         '''
         ...
 
+    @abstractmethod
+    def remove_if(self, predicate: Callable[[T], bool]) -> int:
+
+        ''' Removes every item for which the predicate is true, in a single pass
+        
+            Examples:
+                >>> linked_list = LinkedList.from_sequence([1, 2, 3, 4, 5], data_type=int)
+                >>> linked_list.remove_if(lambda item: item % 2 == 0)
+                2
+                >>> print(linked_list)
+                (1 <-> 3 <-> 5)
+                
+            Arguments:
+                predicate: Called with each item; items it returns True for are removed
+
+            Returns:
+                The number of items removed
+        '''
+        ...
+
+    @abstractmethod
+    def retain_if(self, predicate: Callable[[T], bool]) -> int:
+
+        ''' Keeps only the items for which the predicate is true, in a single pass
+        
+            Examples:
+                >>> linked_list = LinkedList.from_sequence([1, 2, 3, 4, 5], data_type=int)
+                >>> linked_list.retain_if(lambda item: item % 2 == 0)
+                3
+                >>> print(linked_list)
+                (2 <-> 4)
+                
+            Arguments:
+                predicate: Called with each item; items it returns False for are removed
+
+            Returns:
+                The number of items removed
+        '''
+        ...
+
     @abstractmethod
     def pop(self) -> T:
 
@@ -397,9 +495,10 @@ class ILinkedList[T](abc.ABC):
         ...
     
     @abstractmethod
-    def __iter__(self) -> ILinkedList[T]:
+    def __iter__(self) -> Iterator[T]:
 
-        ''' Returns an iterator for the list
+        ''' Returns a new, independent iterator for the list. Modifying the list while iterating over it
+            makes the iterator raise RuntimeError.
         
             Examples:
                 >>> linked_list = LinkedList(data_type=str)
@@ -415,37 +514,9 @@ class ILinkedList[T](abc.ABC):
 
             Returns:
                 An iterator for the list
-        '''
-        ...
-
-    @abstractmethod
-    def __next__(self) -> T:
-
-        ''' Returns the next item in the list
-        
-            Examples:
-                >>> linked_list = LinkedList(data_type=str)
-                >>> linked_list.append('dog')
-                >>> linked_list.append('cat')
-                >>> linked_list.append('mouse')
-                >>> iterator = iter(linked_list)
-                >>> next(iterator)
-                'dog'
-                >>> next(iterator)
-                'cat'
-                >>> next(iterator)
-                'mouse'
-                >>> next(iterator)
-                Traceback (most recent call last):
-                    ...
-                StopIteration
-                
-
-            Returns:
-                The next item in the list
 
             Raises:
-                StopIteration: If there are no more items in the list
+                RuntimeError: If the list is modified during iteration
         '''
         ...
 
@@ -1,139 +1,262 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Optional, Sequence, Iterator
+import functools
+import operator
+from typing import Callable, Iterable, Optional, Sequence, Iterator
 from datastructures.ilinkedlist import ILinkedList, T
 
 
 class LinkedList[T](ILinkedList[T]):
 
-    @dataclass
+    @dataclass(slots=True)
     class Node:
         data: T
         next: Optional[LinkedList.Node] = None
         previous: Optional[LinkedList.Node] = None
 
-    def __init__(self, data_type: type = object) -> None:
+    def __init__(self, data_type: type = object, validate_types: bool = True) -> None:
         self.head: Optional[LinkedList.Node] = None
         self.tail: Optional[LinkedList.Node] = None
         self.count: int = 0
+        self._version = 0  # Bumped by every structural change so iterators can fail fast
         self.data_type = data_type
+        # Every item is an instance of object, so only other data types need an isinstance check per insert.
+        self.validate_types = validate_types and data_type is not object
 
     @staticmethod
-    def from_sequence(sequence: Sequence[T], data_type: type = object) -> LinkedList[T]:
-        ll = LinkedList(data_type)
-        for item in sequence:
-            ll.append(item)
+    def from_sequence(sequence: Sequence[T], data_type: type = object, validate_types: bool = True) -> LinkedList[T]:
+        ll = LinkedList(data_type, validate_types)
+        ll.extend(sequence)
         return ll
 
-    def append(self, item: T) -> None:
-        self._check_type(item)
-        new_node = LinkedList.Node(item)
-        if self.tail:
-            self.tail.next = new_node
-            new_node.previous = self.tail
+    def _attach(self, node: LinkedList.Node, previous: Optional[LinkedList.Node], next: Optional[LinkedList.Node]) -> LinkedList.Node:
+        node.previous, node.next = previous, next
+        if previous:
+            previous.next = node
         else:
-            self.head = new_node
-        self.tail = new_node
+            self.head = node
+        if next:
+            next.previous = node
+        else:
+            self.tail = node
         self.count += 1
+        self._version += 1
+        return node
 
-    def prepend(self, item: T) -> None:
-        self._check_type(item)
-        new_node = LinkedList.Node(item)
-        if self.head:
-            self.head.previous = new_node
-            new_node.next = self.head
+    def _attach_chain(self, first: LinkedList.Node, last: LinkedList.Node, length: int,
+                      previous: Optional[LinkedList.Node], next: Optional[LinkedList.Node]) -> None:
+        first.previous, last.next = previous, next
+        if previous:
+            previous.next = first
         else:
-            self.tail = new_node
-        self.head = new_node
-        self.count += 1
+            self.head = first
+        if next:
+            next.previous = last
+        else:
+            self.tail = last
+        self.count += length
+        self._version += 1
 
-    def insert_before(self, target: T, item: T) -> None:
-        self._check_type(item)
+    def _check_node(self, node: LinkedList.Node) -> None:
+        # Only the head of a list has no previous node, so this rejects unlinked and cleared handles in O(1).
+        if node.previous is None and self.head is not node:
+            raise ValueError("Node is not in the list.")
+
+    def _detach(self, node: LinkedList.Node) -> None:
+        if node.previous:
+            node.previous.next = node.next
+        elif self.head is node:
+            self.head = node.next
+        else:
+            raise ValueError("Node is not in the list.")
+        if node.next:
+            node.next.previous = node.previous
+        else:
+            self.tail = node.previous
+        node.previous = node.next = None
+        self.count -= 1
+        self._version += 1
+
+    def append(self, item: T) -> LinkedList.Node:
+        if self.validate_types:
+            self._check_type(item)
+        return self._attach(LinkedList.Node(item), self.tail, None)
+
+    def prepend(self, item: T) -> LinkedList.Node:
+        if self.validate_types:
+            self._check_type(item)
+        return self._attach(LinkedList.Node(item), None, self.head)
+
+    def extend(self, items: Iterable[T]) -> None:
+        """Append every item, building the new nodes into a chain that is linked in once at the end.
+        If an item has the wrong type the list is left unchanged."""
+        validate, data_type = self.validate_types, self.data_type
+        first = last = None
+        length = 0
+        for item in items:
+            if validate and not isinstance(item, data_type):
+                self._check_type(item)
+            node = LinkedList.Node(item, None, last)
+            if last:
+                last.next = node
+            else:
+                first = node
+            last = node
+            length += 1
+        if first:
+            self._attach_chain(first, last, length, self.tail, None)
+
+    def splice(self, other: LinkedList[T], node: Optional[LinkedList.Node] = None) -> None:
+        """Move every node of other into this list before node, or at the end if node is None, in O(1).
+        other is left empty and handles to its nodes now belong to this list.
+
+        node must be a handle into this list. Nodes do not record their list, so a handle into a third list
+        cannot be told apart in O(1) and would corrupt both lists; only unlinked handles are rejected."""
+        if other is self:
+            raise ValueError("Cannot splice a list into itself.")
+        if self.validate_types and not (other.validate_types and issubclass(other.data_type, self.data_type)):
+            raise TypeError(f"Cannot splice a list of {other.data_type} into a list of {self.data_type}")
+        if node is not None:
+            self._check_node(node)
+        if other.head is None:
+            return
+        self._attach_chain(other.head, other.tail, other.count, node.previous if node else self.tail, node)
+        # Reset other without clear(), which would cut the chain that now belongs to this list.
+        other.head = other.tail = None
+        other.count = 0
+        other._version += 1
+
+    def concat(self, other: LinkedList[T]) -> None:
+        """Move every node of other to the end of this list in O(1), leaving other empty. Handles to the moved
+        nodes must be used with this list afterwards."""
+        self.splice(other)
+
+    def find(self, item: T) -> Optional[LinkedList.Node]:
+        """Return the node holding the first occurrence of item, or None if it is not in the list."""
         current = self.head
         while current:
-            if current.data == target:
-                new_node = LinkedList.Node(item, next=current, previous=current.previous)
-                if current.previous:
-                    current.previous.next = new_node
-                else:
-                    self.head = new_node
-                current.previous = new_node
-                self.count += 1
-                return
+            if current.data == item:
+                return current
             current = current.next
-        raise ValueError(f"Target {target} not found in the list.")
+        return None
+
+    def insert_before(self, target: T, item: T) -> None:
+        if self.validate_types:
+            self._check_type(target)
+        node = self.find(target)
+        if node is None:
+            raise ValueError(f"Target {target} not found in the list.")
+        self.insert_before_node(node, item)
 
     def insert_after(self, target: T, item: T) -> None:
-        self._check_type(item)
-        current = self.head
-        while current:
-            if current.data == target:
-                new_node = LinkedList.Node(item, previous=current, next=current.next)
-                if current.next:
-                    current.next.previous = new_node
-                else:
-                    self.tail = new_node
-                current.next = new_node
-                self.count += 1
-                return
-            current = current.next
-        raise ValueError(f"Target {target} not found in the list.")
+        if self.validate_types:
+            self._check_type(target)
+        node = self.find(target)
+        if node is None:
+            raise ValueError(f"Target {target} not found in the list.")
+        self.insert_after_node(node, item)
+
+    # The node methods below run in O(1). A node handle comes from append, prepend, find or another node
+    # method, and must belong to this list; a handle that was unlinked or cleared is rejected with ValueError.
+    # Nodes do not record their list, so passing a handle into another list is not detected and corrupts both.
+
+    def insert_before_node(self, node: LinkedList.Node, item: T) -> LinkedList.Node:
+        """Insert item before the node and return the new node."""
+        self._check_node(node)
+        if self.validate_types:
+            self._check_type(item)
+        return self._attach(LinkedList.Node(item), node.previous, node)
+
+    def insert_after_node(self, node: LinkedList.Node, item: T) -> LinkedList.Node:
+        """Insert item after the node and return the new node."""
+        self._check_node(node)
+        if self.validate_types:
+            self._check_type(item)
+        return self._attach(LinkedList.Node(item), node, node.next)
+
+    def unlink(self, node: LinkedList.Node) -> T:
+        """Remove the node from the list and return its item."""
+        self._detach(node)
+        return node.data
+
+    def move_to_front(self, node: LinkedList.Node) -> None:
+        """Move the node to the head of the list, keeping the same handle."""
+        if self.head is not node:
+            self._detach(node)
+            self._attach(node, None, self.head)
 
     def remove(self, item: T) -> None:
-        current = self.head
-        while current:
-            if current.data == item:
-                if current.previous:
-                    current.previous.next = current.next
-                else:
-                    self.head = current.next
-                if current.next:
-                    current.next.previous = current.previous
-                else:
-                    self.tail = current.previous
-                self.count -= 1
-                return
-            current = current.next
-        raise ValueError(f"Item {item} not found in the list.")
+        if self.validate_types:
+            self._check_type(item)
+        node = self.find(item)
+        if node is None:
+            raise ValueError(f"Item {item} not found in the list.")
+        self._detach(node)
+
+    def remove_all(self, item: T) -> int:
+        if self.validate_types:
+            self._check_type(item)
+        return self._remove_matching(functools.partial(operator.eq, item), True)
+
+    def remove_if(self, predicate: Callable[[T], bool]) -> int:
+        return self._remove_matching(predicate, True)
 
-    def remove_all(self, item: T) -> None:
+    def retain_if(self, predicate: Callable[[T], bool]) -> int:
+        return self._remove_matching(predicate, False)
+
+    def _remove_matching(self, predicate: Callable[[T], bool], remove: bool) -> int:
+        """Remove the items whose predicate result equals remove in one pass, calling predicate once per item
+        and splicing out each run of consecutive removed nodes with a single relink. Removed nodes keep their
+        next pointer, so a reader standing on one can still walk back into the list, but lose previous, so
+        unlink rejects them."""
+        removed = 0
+        kept: Optional[LinkedList.Node] = None  # Last node kept so far
+        run_start: Optional[LinkedList.Node] = None  # First node of the run being removed
+        run_length = 0
         current = self.head
         while current:
-            if current.data == item:
-                if current.previous:
-                    current.previous.next = current.next
-                else:
-                    self.head = current.next
-                if current.next:
-                    current.next.previous = current.previous
-                else:
-                    self.tail = current.previous
-                self.count -= 1
+            if bool(predicate(current.data)) == remove:
+                if run_start is None:
+                    run_start = current
+                run_length += 1
+            else:
+                if run_start is not None:
+                    self._cut_run(kept, run_start, current, run_length)
+                    removed += run_length
+                    run_start, run_length = None, 0
+                kept = current
             current = current.next
+        if run_start is not None:
+            self._cut_run(kept, run_start, None, run_length)
+            removed += run_length
+        return removed
+
+    def _cut_run(self, kept: Optional[LinkedList.Node], run_start: LinkedList.Node,
+                 end: Optional[LinkedList.Node], run_length: int) -> None:
+        """Splice out the run of nodes from run_start up to end in one relink, then detach its nodes."""
+        if kept:
+            kept.next = end
+        else:
+            self.head = end
+        if end:
+            end.previous = kept
+        else:
+            self.tail = kept
+        self.count -= run_length
+        self._version += 1
+        while run_start is not end:
+            run_start.previous = None
+            run_start = run_start.next
 
     def pop(self) -> T:
         if not self.tail:
             raise IndexError("Pop from empty list")
-        value = self.tail.data
-        if self.tail.previous:
-            self.tail = self.tail.previous
-            self.tail.next = None
-        else:
-            self.head = self.tail = None
-        self.count -= 1
-        return value
+        return self.unlink(self.tail)
 
     def pop_front(self) -> T:
         if not self.head:
             raise IndexError("Pop from empty list")
-        value = self.head.data
-        if self.head.next:
-            self.head = self.head.next
-            self.head.previous = None
-        else:
-            self.head = self.tail = None
-        self.count -= 1
-        return value
+        return self.unlink(self.head)
 
     @property
     def front(self) -> T:
@@ -155,32 +278,33 @@ class LinkedList[T](ILinkedList[T]):
         return self.count
 
     def clear(self) -> None:
+        """Remove every item. The old nodes are cut apart so that their handles are rejected afterwards."""
+        current = self.head
+        while current:
+            current.previous, current.next, current = None, None, current.next
         self.head = self.tail = None
         self.count = 0
+        self._version += 1
 
     def __contains__(self, item: T) -> bool:
+        return self.find(item) is not None
+
+    def __iter__(self) -> Iterator[T]:
+        version = self._version
         current = self.head
         while current:
-            if current.data == item:
-                return True
+            yield current.data
+            if self._version != version:
+                raise RuntimeError("LinkedList changed during iteration")
             current = current.next
-        return False
-
-    def __iter__(self) -> Iterator[T]:
-        self.current = self.head
-        return self
-
-    def __next__(self) -> T:
-        if not self.current:
-            raise StopIteration
-        value = self.current.data
-        self.current = self.current.next
-        return value
 
     def __reversed__(self) -> Iterator[T]:
+        version = self._version
         current = self.tail
         while current:
             yield current.data
+            if self._version != version:
+                raise RuntimeError("LinkedList changed during iteration")
             current = current.previous
 
     def __eq__(self, other: object) -> bool:
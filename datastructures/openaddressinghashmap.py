@@ -0,0 +1,149 @@
+import time
+from typing import Callable, Iterator, Optional, Tuple
+
+from datastructures.hashmap import HashMap, _MISSING
+from datastructures.ihashmap import KT, VT
+
+_TOMBSTONE = object()  # Marks a deleted slot so probe sequences that pass through it keep going
+
+class OpenAddressingHashMap(HashMap[KT, VT]):
+    """A HashMap that stores entries in parallel hash/key/value lists with linear probing instead of
+    chaining each bucket through a LinkedList. Deleted entries leave tombstones that are reused by later
+    inserts and purged when the table is rehashed."""
+    _lookup_method = '_find_slot'
+
+    def __init__(self, number_of_buckets=7, load_factor=0.75, custom_hash_function: Optional[Callable[[KT], int]] = None,
+                 stable_hash: bool = False, min_load_factor: Optional[float] = None) -> None:
+        if not 0 < load_factor < 1:
+            raise ValueError("load_factor must be between 0 and 1 for open addressing")
+        super().__init__(number_of_buckets, load_factor, custom_hash_function, stable_hash, min_load_factor)
+        self.buckets = []
+        self.filled = 0  # Live entries plus tombstones; an empty slot always ends a probe sequence
+        self._allocate(number_of_buckets)
+
+    def _allocate(self, number_of_buckets: int) -> None:
+        self.number_of_buckets = number_of_buckets
+        self._hashes: list = [None] * number_of_buckets
+        self._keys: list = [None] * number_of_buckets
+        self._values: list = [None] * number_of_buckets
+
+    def _find_slot(self, key, key_hash: int) -> int:
+        """Return the slot holding the key, or -1 if it is not in the table."""
+        hashes, keys = self._hashes, self._keys
+        index = key_hash % self.number_of_buckets
+        while hashes[index] is not None:
+            slot_key = keys[index]
+            if hashes[index] == key_hash and slot_key is not _TOMBSTONE and slot_key == key:
+                return index
+            index = (index + 1) % self.number_of_buckets
+        return -1
+
+    def _resize(self):
+        """Grow the table, or rehash it in place if it is mostly tombstones."""
+        if self.filled / self.number_of_buckets > self.load_factor:
+            grow = self.size / self.number_of_buckets > self.load_factor / 2
+            self._rehash(self.number_of_buckets * 2 if grow else self.number_of_buckets)
+
+    def _rehash(self, number_of_buckets: int) -> None:
+        """Reinsert the live entries by their cached hash, dropping every tombstone."""
+        start = time.perf_counter()
+        entries = [(key_hash, key, self._values[index]) for index, (key_hash, key) in enumerate(zip(self._hashes, self._keys))
+                   if key_hash is not None and key is not _TOMBSTONE]
+        self._allocate(number_of_buckets)
+        hashes, keys, values = self._hashes, self._keys, self._values
+        for key_hash, key, value in entries:
+            index = key_hash % number_of_buckets
+            while hashes[index] is not None:
+                index = (index + 1) % number_of_buckets
+            hashes[index], keys[index], values[index] = key_hash, key, value
+        self.filled = self.size
+        self._note_resize(start)
+
+    def _chain_lengths(self) -> Iterator[int]:
+        """Yield the probe length of every live entry: 1 when it sits in its home slot."""
+        for index in self._live_slots():
+            yield (index - self._hashes[index]) % self.number_of_buckets + 1
+
+    def __getitem__(self, key):
+        """Retrieve the value associated with the key."""
+        index = self._find_slot(key, self.custom_hash_function(key))
+        if index < 0:
+            raise KeyError(f"Key '{key}' not found")
+        return self._values[index]
+
+    def _store(self, key, key_hash: int, value) -> None:
+        """Insert or update a key-value pair, reusing the first tombstone on the probe sequence."""
+        hashes, keys = self._hashes, self._keys
+        index = key_hash % self.number_of_buckets
+        free = -1
+        while hashes[index] is not None:
+            slot_key = keys[index]
+            if slot_key is _TOMBSTONE:
+                if free < 0:
+                    free = index
+            elif hashes[index] == key_hash and slot_key == key:
+                self._values[index] = value
+                return
+            index = (index + 1) % self.number_of_buckets
+        if free < 0:
+            free = index
+            self.filled += 1
+        hashes[free], keys[free], self._values[free] = key_hash, key, value
+        self.size += 1
+        self._resize()
+
+    def get(self, key, default=None):
+        """Return the value for the key, or default if it is not in the hashmap."""
+        index = self._find_slot(key, self.custom_hash_function(key))
+        return default if index < 0 else self._values[index]
+
+    def setdefault(self, key, default=None):
+        """Return the value for the key, inserting default first if the key is not in the hashmap."""
+        key_hash = self.custom_hash_function(key)
+        index = self._find_slot(key, key_hash)
+        if index >= 0:
+            return self._values[index]
+        self._store(key, key_hash, default)
+        return default
+
+    def pop(self, key, default=_MISSING):
+        """Remove the key and return its value, leaving a tombstone in its slot."""
+        index = self._find_slot(key, self.custom_hash_function(key))
+        if index < 0:
+            if default is _MISSING:
+                raise KeyError(f"Key '{key}' not found")
+            return default
+        value = self._values[index]
+        self._keys[index] = _TOMBSTONE
+        self._values[index] = None
+        self.size -= 1
+        self._shrink()
+        return value
+
+    def __contains__(self, key) -> bool:
+        """Check whether the hashmap contains a specific key."""
+        return self._find_slot(key, self.custom_hash_function(key)) >= 0
+
+    def _live_slots(self) -> Iterator[int]:
+        for index, key_hash in enumerate(self._hashes):
+            if key_hash is not None and self._keys[index] is not _TOMBSTONE:
+                yield index
+
+    def keys(self) -> Iterator:
+        """Return an iterator over the keys in the hashmap."""
+        for index in self._live_slots():
+            yield self._keys[index]
+
+    def values(self) -> Iterator:
+        """Return an iterator over the values in the hashmap."""
+        for index in self._live_slots():
+            yield self._values[index]
+
+    def items(self) -> Iterator[Tuple]:
+        """Return an iterator over the key-value pairs in the hashmap."""
+        for index in self._live_slots():
+            yield (self._keys[index], self._values[index])
+
+    def __repr__(self) -> str:
+        """Return a developer-friendly representation of the hashmap."""
+        return f"OpenAddressingHashMap({str(self)})"
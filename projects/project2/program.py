@@ -1,26 +1,56 @@
 import random
-from array2d import Array2D 
-import copy
+from datastructures.array2d import Array2D
 import time
 import os
+import numpy as np
 from projects.project2.kbhit import KBHit
 
 LIVE_CELL = '🦠'
 EMPTY_CELL = ' '
+ENGINES = ('vectorized', 'classic')
+
+
+def zobrist_keys(cells: np.ndarray) -> np.ndarray:
+    """Returns a pseudo-random 64-bit key for each flat cell index (splitmix64), so no key table is stored."""
+    z = (cells.astype(np.uint64) + np.uint64(1)) * np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def zobrist_hash(cells: np.ndarray) -> int:
+    """XORs together the keys of the flat indices of all set cells."""
+    return int(np.bitwise_xor.reduce(zobrist_keys(np.flatnonzero(cells)), initial=np.uint64(0)))
+
 
 class GameOfLife:
-    def __init__(self, rows: int, cols: int):
+    def __init__(self, rows: int, cols: int, engine: str = 'vectorized'):
+        if engine not in ENGINES:
+            raise ValueError(f"engine must be one of {ENGINES}")
         self.rows = rows
         self.cols = cols
-        self.grid = Array2D.empty(rows, cols, str)
-        self.scratch_grid = Array2D.empty(rows, cols, str)
-        self.history = []
+        self.engine = engine
+        # Cells are stored as booleans; LIVE_CELL/EMPTY_CELL are only used when rendering.
+        self.grid = Array2D.empty(rows, cols, bool)
+        self.scratch_grid = Array2D.empty(rows, cols, bool)
+        # Maps the Zobrist hash of every generation seen so far to its generation number.
+        self.history: dict[int, int] = {}
+        self.generation = 0
+        # Hash of the live cells in grid, updated incrementally in update_grid (None until first computed).
+        self._hash: int | None = None
+        # Work buffers for the vectorized engine, allocated once and reused every generation.
+        self._padded = np.zeros((rows + 2, cols + 2), dtype=np.uint8)
+        self._neighbors = np.zeros((rows, cols), dtype=np.uint8)
 
     def seed_grid(self, random_seed: bool = True, config_file: str = None):
+        # A new board starts a new run, so forget the previous run's generations.
+        self._hash = None
+        self.history.clear()
+        self.generation = 0
         if random_seed:
             for row in range(self.rows):
                 for col in range(self.cols):
-                    self.grid[row][col] = LIVE_CELL if random.random() < 0.5 else EMPTY_CELL
+                    self.grid[row][col] = random.random() < 0.5
         else:
             self.load_configuration(config_file)
 
@@ -28,8 +58,8 @@ class GameOfLife:
         with open(config_file, 'r') as file:
             lines = file.readlines()
             for row, line in enumerate(lines):
-                for col, char in enumerate(line.strip()):
-                    self.grid[row][col] = char
+                for col, char in enumerate(line.rstrip('\n')):
+                    self.grid[row][col] = char == LIVE_CELL
 
     def count_neighbors(self, row: int, col: int) -> int:
         directions = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
@@ -37,44 +67,74 @@ class GameOfLife:
         for dr, dc in directions:
             r, c = row + dr, col + dc
             if 0 <= r < self.rows and 0 <= c < self.cols:
-                count += self.grid[r][c] == LIVE_CELL
+                count += bool(self.grid[r][c])
         return count
 
     def compute_next_generation(self):
+        if self.engine == 'vectorized':
+            self._compute_next_generation_vectorized()
+            return
         for row in range(self.rows):
             for col in range(self.cols):
                 neighbors = self.count_neighbors(row, col)
-                if self.grid[row][col] == LIVE_CELL:
-                    if neighbors < 2 or neighbors > 3:
-                        self.scratch_grid[row][col] = EMPTY_CELL
-                    else:
-                        self.scratch_grid[row][col] = LIVE_CELL
+                if self.grid[row][col]:
+                    self.scratch_grid[row][col] = 2 <= neighbors <= 3
                 else:
-                    if neighbors == 3:
-                        self.scratch_grid[row][col] = LIVE_CELL
-                    else:
-                        self.scratch_grid[row][col] = EMPTY_CELL
+                    self.scratch_grid[row][col] = neighbors == 3
+
+    def _compute_next_generation_vectorized(self):
+        # Neighbor counts are the sum of the eight shifted copies of a zero-padded grid.
+        cells = self.grid.to_numpy(copy=False)
+        padded, neighbors = self._padded, self._neighbors
+        padded[1:-1, 1:-1] = cells
+        neighbors.fill(0)
+        for dr in range(3):
+            for dc in range(3):
+                if dr != 1 or dc != 1:
+                    neighbors += padded[dr:dr + self.rows, dc:dc + self.cols]
+        next_cells = self.scratch_grid.to_numpy(copy=False)
+        np.equal(neighbors, 3, out=next_cells)
+        next_cells |= cells & (neighbors == 2)
 
     def update_grid(self):
-        self.grid = copy.deepcopy(self.scratch_grid)
+        if self._hash is not None:
+            changed = self.grid.to_numpy(copy=False) != self.scratch_grid.to_numpy(copy=False)
+            self._hash ^= zobrist_hash(changed)
+        # Every cell of scratch_grid is rewritten each generation, so the buffers can simply swap roles.
+        self.grid, self.scratch_grid = self.scratch_grid, self.grid
+
+    def record_generation(self) -> int | None:
+        """Adds the current grid to the history and returns the cycle period if it repeats an earlier generation."""
+        if self._hash is None:
+            self._hash = zobrist_hash(self.grid.to_numpy(copy=False))
+        first_seen = self.history.get(self._hash)
+        self.history[self._hash] = self.generation
+        self.generation += 1
+        return None if first_seen is None else self.generation - 1 - first_seen
+
+    def render(self) -> str:
+        cells = np.where(self.grid.to_numpy(copy=False), LIVE_CELL, EMPTY_CELL)
+        return '\n'.join(''.join(row) for row in cells)
 
     def display_grid(self):
         os.system('clear' if os.name == 'posix' else 'cls')
-        print(str(self.grid))
+        print(self.render())
 
     def run_simulation(self, mode: str):
         kb = KBHit()
+        self.record_generation()
         while True:
             self.display_grid()
             self.compute_next_generation()
             self.update_grid()
-            self.history.append(copy.deepcopy(self.grid))
 
-            if len(self.history) > 5:
-                self.history.pop(0)
-            if len(self.history) >= 2 and self.history[-1] == self.history[-2]:
+            period = self.record_generation()
+            if period == 1:
                 print("Stable configuration detected. Simulation ends.")
                 break
+            if period is not None:
+                print(f"Oscillator with period {period} detected. Simulation ends.")
+                break
 
             if mode == 'automatic':
                 time.sleep(1)
@@ -1,6 +1,6 @@
 import copy
 import pytest
-from datastructures.array import Array
+from datastructures.array import Array, ArrayView
 
 from tests.car import Car, Color, Make, Model
 
@@ -130,3 +130,212 @@ class TestArray:
     def test_bracket_operator_should_raise_a_type_error_if_the_index_is_not_an_integer_or_slice(self, setup_numerical_array: Array):
         with pytest.raises(TypeError):
             setup_numerical_array['string'] #type: ignore
+
+    def test_constructor_should_store_primitive_types_in_a_native_numpy_buffer(self, setup_numerical_array: Array):
+        assert setup_numerical_array.is_primitive
+        assert not Array(['zero', 'one'], str).is_primitive
+
+    def test_constructor_should_raise_a_type_error_if_a_primitive_sequence_contains_mixed_types(self):
+        with pytest.raises(TypeError):
+            Array([1, 2.5, 3], int)
+        with pytest.raises(TypeError):
+            Array([1, None, 3], int)
+
+    def test_constructor_should_raise_an_overflow_error_if_an_int_does_not_fit_in_64_bits(self):
+        with pytest.raises(OverflowError):
+            Array([2**63], int)
+        with pytest.raises(OverflowError):
+            Array([1, 2**70], int)
+        assert Array([2**63 - 1], int)[0] == 2**63 - 1
+        assert Array([2**70], float)[0] == float(2**70)
+
+    def test_extend_should_append_all_items_in_order(self, setup_numerical_array: Array):
+        setup_numerical_array.extend(range(10, 25))
+        assert len(setup_numerical_array) == 25
+        assert list(setup_numerical_array) == list(range(25))
+
+    def test_extend_should_raise_a_type_error_if_the_items_are_not_the_same_type_as_the_array(self, setup_numerical_array: Array):
+        with pytest.raises(TypeError):
+            setup_numerical_array.extend(['string'])
+
+    def test_fill_should_set_every_item_to_the_value(self, setup_numerical_array: Array):
+        setup_numerical_array.fill(7)
+        assert list(setup_numerical_array) == [7] * 10
+
+    def test_map_inplace_should_apply_the_function_to_every_item(self, setup_numerical_array: Array, setup_complex_object_array: Array[Car]):
+        setup_numerical_array.map_inplace(lambda items: items * 2)
+        assert list(setup_numerical_array) == [i * 2 for i in range(10)]
+
+        setup_complex_object_array.map_inplace(copy.copy)
+        assert setup_complex_object_array[0] is not self.car1
+
+    def test_sum_min_max_should_reduce_the_items_of_the_array(self, setup_numerical_array: Array):
+        assert setup_numerical_array.sum() == 45
+        assert setup_numerical_array.min() == 0
+        assert setup_numerical_array.max() == 9
+
+    def test_min_should_raise_a_value_error_if_the_array_is_empty(self):
+        with pytest.raises(ValueError):
+            Array([], int).min()
+
+    def test_filter_should_return_an_array_of_the_items_selected_by_the_mask(self, setup_numerical_array: Array):
+        evens = setup_numerical_array.filter([i % 2 == 0 for i in range(10)])
+        assert list(evens) == [0, 2, 4, 6, 8]
+
+    def test_filter_should_raise_a_value_error_if_the_mask_length_does_not_match(self, setup_numerical_array: Array):
+        with pytest.raises(ValueError):
+            setup_numerical_array.filter([True, False])
+
+    def test_append_front_should_insert_items_at_the_front_of_the_array(self):
+        array = Array[int](data_type=int)
+        for i in range(10):
+            array.append_front(i)
+        assert list(array) == list(range(9, -1, -1))
+
+    def test_pop_front_should_remove_items_from_the_front_of_the_array_in_order(self, setup_numerical_array: Array):
+        for i in range(5):
+            assert setup_numerical_array.pop_front() == i
+        setup_numerical_array.append(10)
+        setup_numerical_array.append_front(4)
+        assert list(setup_numerical_array) == list(range(4, 11))
+
+    def test_del_operator_should_keep_the_order_when_deleting_near_the_front_or_back(self, setup_numerical_array: Array):
+        del setup_numerical_array[1]
+        del setup_numerical_array[-1 + len(setup_numerical_array)]
+        assert list(setup_numerical_array) == [0, 2, 3, 4, 5, 6, 7, 8]
+
+    def test_pop_should_shrink_the_physical_size_when_the_array_falls_below_the_shrink_threshold(self):
+        array = Array[int](list(range(1000)), int)
+        while len(array) > 10:
+            array.pop()
+        assert array.capacity < 100
+        assert list(array) == list(range(10))
+
+    def test_constructor_should_raise_a_value_error_if_the_capacity_policy_would_thrash(self):
+        with pytest.raises(ValueError):
+            Array([], int, growth_factor=1)
+        with pytest.raises(ValueError):
+            Array([], int, growth_factor=2, shrink_threshold=0.5)
+
+    def test_reserve_should_grow_the_physical_size_without_changing_the_items(self, setup_numerical_array: Array):
+        setup_numerical_array.reserve(100)
+        assert setup_numerical_array.capacity >= 100
+        assert list(setup_numerical_array) == list(range(10))
+
+    def test_constructor_should_derive_the_shrink_threshold_from_a_large_growth_factor(self):
+        array = Array[int]([], int, growth_factor=5)
+        array.extend(range(100))
+        assert list(array) == list(range(100))
+
+    def test_reserve_should_keep_its_capacity_when_items_are_popped(self, setup_numerical_array: Array):
+        setup_numerical_array.reserve(1000)
+        setup_numerical_array.pop()
+        assert setup_numerical_array.capacity >= 1000
+        setup_numerical_array.shrink_to_fit()
+        assert setup_numerical_array.capacity == 9
+
+    def test_clear_should_release_the_buffer(self):
+        array = Array[int](list(range(100000)), int)
+        array.clear()
+        assert len(array) == 0
+        assert array.capacity == 0
+        array.append(1)
+        assert list(array) == [1]
+
+    def test_shrink_to_fit_should_release_unused_capacity(self, setup_numerical_array: Array):
+        setup_numerical_array.append(10)
+        setup_numerical_array.shrink_to_fit()
+        assert setup_numerical_array.capacity == 11
+        assert list(setup_numerical_array) == list(range(11))
+
+    def test_bracket_operator_should_return_a_view_that_supports_negative_indices_and_steps(self, setup_numerical_array: Array):
+        view = setup_numerical_array[-2:1:-3]
+        assert isinstance(view, ArrayView)
+        assert list(view) == [8, 5, 2]
+        assert view[-1] == 2
+
+    def test_slice_view_should_keep_its_items_when_the_parent_is_modified(self, setup_numerical_array: Array):
+        view = setup_numerical_array[0:3]
+        setup_numerical_array[0] = 100
+        del setup_numerical_array[1]
+        assert list(view) == [0, 1, 2]
+
+    def test_modifying_a_slice_view_should_not_modify_the_parent(self, setup_numerical_array: Array):
+        view = setup_numerical_array[0:3]
+        view[0] = 100
+        view.append(3)
+        assert list(view) == [100, 1, 2, 3]
+        assert setup_numerical_array[0] == 0
+
+    def test_open_mmap_should_persist_appended_items_across_reopening(self, tmp_path):
+        path = tmp_path / 'numbers.arr'
+        with Array.open_mmap(path, int, 'w+') as array:
+            array.extend(range(1000))
+            array.append_front(-1)
+        reopened = Array.open_mmap(path, int, 'r')
+        assert list(reopened) == [-1] + list(range(1000))
+
+    def test_open_mmap_should_raise_a_value_error_when_writing_to_a_read_only_array(self, tmp_path):
+        path = tmp_path / 'numbers.arr'
+        Array.open_mmap(path, float, 'w+').close()
+        with pytest.raises(ValueError):
+            Array.open_mmap(path, float, 'r').append(1.0)
+        with pytest.raises(ValueError):
+            Array.open_mmap(path, int, 'r')
+
+    def test_open_mmap_should_close_a_read_only_array_and_keep_its_views(self, tmp_path):
+        path = tmp_path / 'numbers.arr'
+        with Array.open_mmap(path, int, 'w+') as array:
+            array.extend(range(10))
+        with Array.open_mmap(path, int, 'r') as array:
+            view = array[2:5]
+            assert list(array) == list(range(10))
+        assert len(array) == 0
+        assert list(view) == [2, 3, 4]
+
+    def test_copying_a_memory_mapped_array_should_not_alias_the_file(self, tmp_path):
+        path = tmp_path / 'numbers.arr'
+        with Array.open_mmap(path, int, 'w+') as array:
+            array.extend(range(10))
+            size = path.stat().st_size
+            duplicate = copy.deepcopy(array)
+            duplicate.extend(range(100))
+            duplicate[0] = -999
+            assert array[0] == 0
+        assert path.stat().st_size == size
+        assert list(Array.open_mmap(path, int, 'r')) == list(range(10))
+        assert list(duplicate) == [-999] + list(range(1, 10)) + list(range(100))
+
+    def test_index_should_return_the_first_position_of_the_item_within_the_range(self, setup_numerical_array: Array):
+        setup_numerical_array.append(3)
+        assert setup_numerical_array.index(3) == 3
+        assert setup_numerical_array.index(3, 4) == 10
+        with pytest.raises(ValueError):
+            setup_numerical_array.index(3, 4, 9)
+
+    def test_count_should_return_the_number_of_occurrences_of_the_item(self, setup_numerical_array: Array):
+        setup_numerical_array.extend([3, 3])
+        assert setup_numerical_array.count(3) == 3
+        assert setup_numerical_array.count('string') == 0
+
+    def test_search_should_compare_numbers_of_another_numeric_type_by_value(self):
+        array = Array[int]([1, 2, 3, 2], int)
+        assert 2.0 in array and 2.5 not in array
+        assert array.index(2.0) == 1
+        assert array.count(2.0) == 2
+        assert Array[int]([1, 2, 3], int, is_sorted=True).index(3.0) == 2
+        assert 1.0 in Array[bool]([False, True], bool)
+
+    def test_sorted_array_should_use_binary_search_and_track_whether_it_is_still_sorted(self):
+        array = Array[int]([1, 3, 5, 7], int, is_sorted=True)
+        assert 5 in array
+        assert 4 not in array
+        array.append(9)
+        assert array.is_sorted
+        array.append(0)
+        assert not array.is_sorted
+        assert 0 in array
+
+    def test_constructor_should_raise_a_value_error_if_a_sorted_sequence_is_not_sorted(self):
+        with pytest.raises(ValueError):
+            Array([3, 1, 2], int, is_sorted=True)
@@ -1,3 +1,4 @@
+import copy
 import pytest
 
 from datastructures.array2d import Array2D
@@ -108,4 +109,47 @@ class TestArray2D:
     def test_init_inconsistent_lengths(self) -> None:
         """Ensures a ValueError is raised if rows in `starting_sequence` have different lengths."""
         with pytest.raises(ValueError, match="must be a sequence of sequences with the same length"):
-            _ = Array2D([[1, 2, 3], [4, 5]], data_type=int)
\ No newline at end of file
+            _ = Array2D([[1, 2, 3], [4, 5]], data_type=int)
+
+    # ✅ Test Tuple Indexing
+    def test_tuple_indexing(self, filled3x3: Array2D[int]) -> None:
+        """Ensures grid[r, c] reads and writes the same cells as grid[r][c]."""
+        assert filled3x3[1, 2] == 6
+        filled3x3[1, 2] = 42
+        assert filled3x3[1][2] == 42
+
+    # ✅ Test Row and Column Views
+    def test_row_and_column_views(self, filled3x3: Array2D[int]) -> None:
+        """Ensures row and column views share the grid's storage."""
+        assert list(filled3x3.column(1)) == [2, 5, 8]
+        filled3x3.row(0)[0] = 10
+        assert filled3x3[0][0] == 10
+        filled3x3.column(2)[1] = 11
+        assert filled3x3[1, 2] == 11
+        with pytest.raises(TypeError):
+            filled3x3.row(0)[0] = 2.7
+        with pytest.raises(TypeError):
+            filled3x3.column(0)[0] = 2.7
+        assert filled3x3[0][0] == 10
+
+    # ✅ Test Equality and Deep Copy
+    def test_eq_and_deepcopy(self, filled3x3: Array2D[int]) -> None:
+        """Ensures a deep copy is equal but does not share rows with the original."""
+        copied = copy.deepcopy(filled3x3)
+        assert copied == filled3x3
+        copied[0][0] = 100
+        assert filled3x3[0][0] == 1
+        assert copied != filled3x3
+
+    # ✅ Test Type Checks on Assignment
+    def test_setitem_rejects_wrong_types(self, filled3x3: Array2D[int]) -> None:
+        """Ensures both assignment paths enforce the element type like Array does."""
+        with pytest.raises(TypeError):
+            filled3x3[0][0] = 2.7
+        with pytest.raises(TypeError):
+            filled3x3[0, 1] = 9.9
+        grid = Array2D.empty(2, 2, bool)
+        with pytest.raises(TypeError):
+            grid[0][0] = 'x'
+        grid[1, 1] = True
+        assert filled3x3[0][0] == 1 and filled3x3[0, 1] == 2 and grid[1][1]
@@ -0,0 +1,105 @@
+from datastructures.cache import LFUCache, LRUCache, TTLCache, memoize
+import pytest
+
+class TestCache:
+
+    def test_lru_evicts_least_recently_used(self):
+        cache = LRUCache[str, int](maxsize=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        assert cache["a"] == 1
+        cache["c"] = 3
+        assert "b" not in cache
+        assert cache.get("a") == 1 and cache.get("c") == 3
+        assert cache.stats.evictions == 1
+
+    def test_hit_and_miss_counters(self):
+        cache = LRUCache[str, int](maxsize=2)
+        cache["a"] = 1
+        cache.get("a")
+        cache.get("missing")
+        with pytest.raises(KeyError):
+            _ = cache["missing"]
+        assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+        assert cache.stats.hit_rate == pytest.approx(1 / 3)
+
+    def test_weight_limit_evicts_until_the_value_fits(self):
+        cache = LRUCache[str, str](maxsize=10, weigher=lambda key, value: len(value))
+        cache["a"] = "xxxx"
+        cache["b"] = "xxxx"
+        cache["c"] = "xxxxxx"
+        assert "a" not in cache and "b" in cache and "c" in cache
+        assert cache.weight == 10
+        with pytest.raises(ValueError):
+            cache["d"] = "x" * 11
+
+    def test_lfu_evicts_least_frequently_used(self):
+        cache = LFUCache[str, int](maxsize=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+        cache["c"] = 3
+        assert "b" not in cache
+        assert cache.frequency("a") == 3
+        assert cache.frequency("c") == 1
+
+    def test_lfu_breaks_ties_by_recency(self):
+        cache = LFUCache[str, int](maxsize=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache["c"] = 3
+        assert "a" not in cache and "b" in cache
+
+    def test_overwrite_never_evicts_the_entry_being_written(self):
+        cache = LFUCache[str, int](maxsize=3, weigher=lambda key, value: value)
+        cache["a"] = cache["b"] = cache["c"] = 1
+        for key in ("a", "b"):
+            for _ in range(5):
+                cache.get(key)
+        cache["c"] = 2
+        assert "c" in cache and "a" not in cache and "b" in cache
+        assert cache.weight == 3
+        assert cache.get("c") == 2
+
+    def test_ttl_expires_entries(self):
+        now = [0.0]
+        cache = TTLCache[str, int](maxsize=10, ttl=5, timer=lambda: now[0])
+        cache["a"] = 1
+        now[0] = 3
+        cache["b"] = 2
+        now[0] = 6
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        now[0] = 9
+        cache["c"] = 3
+        assert len(cache) == 1
+        assert cache.stats.expirations == 2
+
+    def test_pop_and_clear(self):
+        cache = LRUCache[str, int](maxsize=3)
+        cache["a"] = 1
+        cache["b"] = 2
+        assert cache.pop("a") == 1
+        assert cache.pop("a", None) is None
+        cache.clear()
+        assert len(cache) == 0 and cache.weight == 0
+
+    def test_memoize_caches_results(self):
+        calls = []
+        @memoize
+        def square(x: int) -> int:
+            calls.append(x)
+            return x * x
+        assert [square(2), square(2), square(x=2)] == [4, 4, 4]
+        assert calls == [2, 2]
+        assert square.cache.stats.hits == 1
+
+    def test_memoize_with_a_bounded_cache(self):
+        @memoize(LFUCache(maxsize=2))
+        def identity(x: int) -> int:
+            return x
+        for x in range(10):
+            identity(x)
+        assert len(identity.cache) == 2
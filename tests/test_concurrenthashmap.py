@@ -0,0 +1,48 @@
+from concurrent.futures import ThreadPoolExecutor
+from datastructures.concurrenthashmap import ConcurrentHashMap
+import pytest
+
+# Behavior shared with the other engines is tested in test_hashmap.py.
+class TestConcurrentHashMap:
+
+    def test_compute_if_absent_calls_factory_once(self):
+        hashmap = ConcurrentHashMap.from_items((i, str(i)) for i in range(10))
+        calls = []
+        def factory(key: int) -> str:
+            calls.append(key)
+            return "new"
+        assert hashmap.compute_if_absent(5, factory) == "5"
+        assert hashmap.compute_if_absent(99, factory) == "new"
+        assert hashmap.compute_if_absent(99, factory) == "new"
+        assert calls == [99]
+
+    def test_merge_combines_and_removes(self):
+        hashmap = ConcurrentHashMap[int, str]()
+        assert hashmap.merge(1, "a", lambda old, new: old + new) == "a"
+        assert hashmap.merge(1, "b", lambda old, new: old + new) == "ab"
+        assert hashmap.merge(1, "c", lambda old, new: None) is None
+        assert 1 not in hashmap
+
+    def test_concurrent_merges_lose_no_updates(self):
+        hashmap = ConcurrentHashMap[int, int]()
+        def work(worker: int) -> None:
+            for i in range(2000):
+                hashmap.merge(i % 100, 1, lambda old, new: old + new)
+                hashmap[(worker, i)] = i
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(work, range(8)))
+        assert all(hashmap[i] == 160 for i in range(100))
+        assert len(hashmap) == 100 + 8 * 2000
+
+    def test_invalid_concurrency_level(self):
+        with pytest.raises(ValueError):
+            ConcurrentHashMap(concurrency_level=0)
+
+    def test_stats_combine_segments(self):
+        hashmap = ConcurrentHashMap[int, str]()
+        for i in range(10):
+            hashmap[i] = str(i)
+        stats = hashmap.stats()
+        assert stats.size == 10
+        assert stats.number_of_buckets == 16 * 7
+        assert sum(length * count for length, count in stats.chain_lengths.items()) == 10
@@ -0,0 +1,75 @@
+from datastructures.diskhashmap import DiskHashMap
+from datastructures.hashmap import HashMap
+import os
+import pytest
+
+class TestDiskHashMap:
+
+    @pytest.fixture
+    def path(self, tmp_path) -> str:
+        return str(tmp_path / "map.log")
+
+    def test_set_get_and_delete(self, path: str):
+        with DiskHashMap[str, int](path) as hashmap:
+            hashmap["a"] = 1
+            hashmap["b"] = 2
+            hashmap["a"] = 3
+            del hashmap["b"]
+            assert hashmap["a"] == 3
+            assert "b" not in hashmap
+            assert len(hashmap) == 1
+            with pytest.raises(KeyError):
+                del hashmap["b"]
+
+    def test_reopen_restores_entries(self, path: str):
+        with DiskHashMap[int, str](path) as hashmap:
+            for i in range(100):
+                hashmap[i] = str(i)
+            for i in range(0, 100, 2):
+                del hashmap[i]
+        with DiskHashMap[int, str](path) as hashmap:
+            expected = HashMap.from_items((i, str(i)) for i in range(1, 100, 2))
+            assert hashmap == expected
+            assert expected == hashmap
+
+    def test_torn_write_is_truncated_on_reopen(self, path: str):
+        with DiskHashMap[str, str](path) as hashmap:
+            hashmap["kept"] = "value"
+            intact = os.path.getsize(path)
+            hashmap["torn"] = "x" * 100
+        with open(path, "r+b") as file:
+            file.truncate(intact + 20)
+        with DiskHashMap[str, str](path) as hashmap:
+            assert list(hashmap.items()) == [("kept", "value")]
+            hashmap["after"] = "crash"
+        with DiskHashMap[str, str](path) as hashmap:
+            assert hashmap["after"] == "crash"
+            assert os.path.getsize(path) > intact
+
+    def test_compact_drops_dead_records(self, path: str):
+        with DiskHashMap[int, int](path) as hashmap:
+            for round in range(10):
+                for i in range(50):
+                    hashmap[i] = round
+            assert hashmap.garbage_ratio > 0.8
+            size = os.path.getsize(path)
+            hashmap.compact()
+            assert os.path.getsize(path) < size / 5
+            assert hashmap.garbage_ratio == 0
+            assert all(hashmap[i] == 9 for i in range(50))
+        with DiskHashMap[int, int](path) as hashmap:
+            assert len(hashmap) == 50
+
+    def test_background_compaction_keeps_concurrent_writes(self, path: str):
+        with DiskHashMap[int, int](path) as hashmap:
+            for i in range(1000):
+                hashmap[i] = i
+            thread = hashmap.compact(background=True)
+            for i in range(1000, 1200):
+                hashmap[i] = i
+            del hashmap[0]
+            thread.join()
+            assert len(hashmap) == 1199
+            assert all(hashmap[i] == i for i in range(1, 1200))
+        with DiskHashMap[int, int](path) as hashmap:
+            assert len(hashmap) == 1199
@@ -0,0 +1,42 @@
+import random
+
+import numpy as np
+
+from projects.project2.program import GameOfLife
+
+class TestGameOfLife:
+
+    def test_vectorized_and_classic_engines_agree(self) -> None:
+        games = [GameOfLife(12, 15, engine) for engine in ('vectorized', 'classic')]
+        for game in games:
+            random.seed(42)
+            game.seed_grid()
+        for _ in range(10):
+            for game in games:
+                game.compute_next_generation()
+                game.update_grid()
+            vectorized, classic = (game.grid.to_numpy() for game in games)
+            assert np.array_equal(vectorized, classic)
+
+    def _run_until_cycle(self, game: GameOfLife, generations: int = 10) -> int | None:
+        period = game.record_generation()
+        for _ in range(generations):
+            if period is not None:
+                break
+            game.compute_next_generation()
+            game.update_grid()
+            period = game.record_generation()
+        return period
+
+    def _seed(self, game: GameOfLife, config: list[str], tmp_path) -> None:
+        path = tmp_path / 'board.txt'
+        path.write_text('\n'.join(row.replace('#', '🦠').replace('.', ' ') for row in config), encoding='utf-8')
+        game.seed_grid(random_seed=False, config_file=str(path))
+
+    def test_blinker_has_period_2_and_block_has_period_1(self, tmp_path) -> None:
+        game = GameOfLife(5, 5)
+        self._seed(game, ['.....', '..#..', '..#..', '..#..', '.....'], tmp_path)
+        assert self._run_until_cycle(game) == 2
+        self._seed(game, ['.....', '.##..', '.##..', '.....', '.....'], tmp_path)
+        assert game.generation == 0 and not game.history
+        assert self._run_until_cycle(game) == 1
@@ -1,15 +1,24 @@
+from datastructures.concurrenthashmap import ConcurrentHashMap
 from datastructures.hashmap import HashMap
+from datastructures.openaddressinghashmap import OpenAddressingHashMap
+import random
 import pytest
 
 class TestHashMap:
 
+    # The behavior shared by every IHashMap engine is tested against each of them; engine-specific
+    # tests build the engine they check.
+    @pytest.fixture(params=[HashMap, OpenAddressingHashMap, ConcurrentHashMap])
+    def hashmap_class(self, request) -> type[HashMap]:
+        return request.param
+
     @pytest.fixture
-    def empty_hashmap(self) -> HashMap[int, str]:
-        return HashMap[int, str]()
+    def empty_hashmap(self, hashmap_class: type[HashMap]) -> HashMap[int, str]:
+        return hashmap_class[int, str]()
 
     @pytest.fixture
-    def populated_hashmap(self) -> HashMap[int, str]:
-        hashmap = HashMap[int, str]()
+    def populated_hashmap(self, hashmap_class: type[HashMap]) -> HashMap[int, str]:
+        hashmap = hashmap_class[int, str]()
         for i in range(10):
             hashmap[i] = str(i)
         return hashmap
@@ -25,10 +34,12 @@ class TestHashMap:
     def test_update_existing_key(self, populated_hashmap: HashMap[int, str]):
         populated_hashmap[5] = "updated"
         assert populated_hashmap[5] == "updated"
+        assert len(populated_hashmap) == 10
 
     def test_delete_item(self, populated_hashmap: HashMap[int, str]):
         del populated_hashmap[5]
         assert 5 not in populated_hashmap
+        assert len(populated_hashmap) == 9
 
     def test_delete_nonexistent_key(self, empty_hashmap: HashMap[int, str]):
         with pytest.raises(KeyError):
@@ -45,6 +56,12 @@ class TestHashMap:
     def test_iteration(self, populated_hashmap: HashMap[int, str]):
         keys = list(sorted(iter(populated_hashmap)))
         assert keys == list(range(10))
+        assert sorted(populated_hashmap.items()) == [(i, str(i)) for i in range(10)]
+
+    def test_equal_to_another_engine_with_the_same_items(self, populated_hashmap: HashMap[int, str]):
+        assert populated_hashmap == HashMap.from_items((i, str(i)) for i in range(10))
+        assert populated_hashmap == OpenAddressingHashMap.from_items((i, str(i)) for i in range(10))
+        assert populated_hashmap == ConcurrentHashMap.from_items((i, str(i)) for i in range(10))
 
     def test_resize(self, empty_hashmap: HashMap[int, str]):
         for i in range(20):
@@ -52,3 +69,158 @@ class TestHashMap:
         assert len(empty_hashmap) == 20
         for i in range(20):
             assert empty_hashmap[i] == str(i)
+
+    def test_unhashable_keys_fall_back_to_the_stable_hash(self, empty_hashmap: HashMap[int, str]):
+        empty_hashmap[[1, 2]] = "list"  # type: ignore
+        assert empty_hashmap[[1, 2]] == "list"  # type: ignore
+
+    def test_stable_hash_places_keys_in_the_same_buckets_across_processes(self):
+        hashmap = HashMap[str, int](stable_hash=True)
+        hashmap["key"] = 1
+        assert hashmap.custom_hash_function("key") == HashMap._stable_hash_function("key")
+        assert hashmap["key"] == 1
+
+    def test_resize_does_not_rehash_existing_keys(self):
+        calls = []
+        def counting_hash(key: int) -> int:
+            calls.append(key)
+            return key
+        hashmap = HashMap[int, str](custom_hash_function=counting_hash)
+        for i in range(100):
+            hashmap[i] = str(i)
+        assert len(calls) == 100
+        assert hashmap.number_of_buckets > 7
+        assert all(hashmap[i] == str(i) for i in range(100))
+
+    def test_from_items_builds_the_same_engine(self, hashmap_class: type[HashMap]):
+        hashmap = hashmap_class.from_items({i: str(i) for i in range(50)})
+        assert isinstance(hashmap, hashmap_class)
+        assert sorted(hashmap.items()) == [(i, str(i)) for i in range(50)]
+
+    def test_from_items_sizes_the_table_once(self):
+        hashmap = HashMap.from_items((i, str(i)) for i in range(100))
+        assert len(hashmap) == 100
+        presized = HashMap.from_items([(i, str(i)) for i in range(100)])
+        assert presized.number_of_buckets > 100 / presized.load_factor
+        assert hashmap == presized
+        copied = HashMap.from_items(presized)
+        assert copied.resizes == 1
+        copied.update(HashMap.from_items((i, str(i)) for i in range(100, 1100)))
+        assert copied.resizes == 2
+        assert len(copied) == 1100
+
+    def test_update_with_mapping_and_pairs(self, populated_hashmap: HashMap[int, str]):
+        populated_hashmap.update({5: "five", 10: "ten"})
+        populated_hashmap.update([(11, "eleven")])
+        assert populated_hashmap[5] == "five"
+        assert populated_hashmap[11] == "eleven"
+        assert len(populated_hashmap) == 12
+
+    def test_get_setdefault_and_pop(self, populated_hashmap: HashMap[int, str]):
+        assert populated_hashmap.get(5) == "5"
+        assert populated_hashmap.get(99, "missing") == "missing"
+        assert populated_hashmap.setdefault(5, "other") == "5"
+        assert populated_hashmap.setdefault(99, "new") == "new"
+        assert populated_hashmap.pop(99) == "new"
+        assert populated_hashmap.pop(99, None) is None
+        with pytest.raises(KeyError):
+            populated_hashmap.pop(99)
+        assert len(populated_hashmap) == 10
+
+    def test_mass_deletion_shrinks_the_table(self):
+        empty_hashmap = HashMap[int, str]()
+        for i in range(1000):
+            empty_hashmap[i] = str(i)
+        grown = empty_hashmap.number_of_buckets
+        for i in range(990):
+            del empty_hashmap[i]
+        assert empty_hashmap.number_of_buckets < grown / 10
+        assert all(empty_hashmap[i] == str(i) for i in range(990, 1000))
+
+    def test_compact_shrinks_a_reserved_table(self):
+        empty_hashmap = HashMap[int, str]()
+        empty_hashmap.reserve(1000)
+        empty_hashmap[1] = "one"
+        empty_hashmap.compact()
+        assert empty_hashmap.number_of_buckets == 7
+        assert empty_hashmap[1] == "one"
+
+    def test_compact_never_grows_the_table(self):
+        hashmap = HashMap.from_items((i, str(i)) for i in range(5))
+        assert hashmap.number_of_buckets == 7
+        hashmap.compact()
+        assert hashmap.number_of_buckets == 7
+        assert all(hashmap[i] == str(i) for i in range(5))
+
+    def test_invalid_min_load_factor(self):
+        with pytest.raises(ValueError):
+            HashMap(load_factor=0.75, min_load_factor=0.5)
+
+    def test_buckets_are_allocated_lazily(self):
+        empty_hashmap = HashMap[int, str]()
+        assert all(bucket is None for bucket in empty_hashmap.buckets)
+        empty_hashmap[1] = "one"
+        assert sum(bucket is not None for bucket in empty_hashmap.buckets) == 1
+
+    def test_incremental_resize_keeps_every_key_reachable(self):
+        hashmap = HashMap[int, str](incremental_resize=True, rehash_batch=1)
+        for i in range(1000):
+            hashmap[i] = str(i)
+            assert hashmap[i // 2] == str(i // 2)
+        for i in range(0, 1000, 2):
+            del hashmap[i]
+        assert len(hashmap) == 500
+        assert sorted(hashmap.keys()) == list(range(1, 1000, 2))
+        assert all(hashmap[i] == str(i) for i in range(1, 1000, 2))
+
+    def test_incremental_resize_migrates_a_bounded_batch_per_operation(self):
+        hashmap = HashMap[int, str](incremental_resize=True, rehash_batch=2)
+        for i in range(6):
+            hashmap[i] = str(i)
+        assert hashmap._old_buckets is not None
+        hashmap.get(0)
+        assert hashmap._rehash_index == 2
+        hashmap.compact()
+        assert hashmap._old_buckets is None
+        assert all(hashmap[i] == str(i) for i in range(6))
+
+    def test_lookups_during_iteration_keep_every_key(self):
+        hashmap = HashMap[int, str](incremental_resize=True, rehash_batch=1)
+        expected = []
+        for i in range(1, 100):
+            key = i * 7919 % 1000  # Scattered keys, so migrated buckets land on both sides of the cursor
+            hashmap[key] = str(key)
+            expected.append(key)
+            keys = []
+            for key in hashmap.keys():
+                keys.append(key)
+                assert hashmap[key] == str(key)
+            assert sorted(keys) == sorted(expected)
+
+    def test_stats_reveal_clustering(self):
+        clustered = HashMap[int, str](custom_hash_function=lambda key: 0)
+        for i in range(20):
+            clustered[i] = str(i)
+        stats = clustered.stats()
+        assert stats.size == 20
+        assert stats.max_chain_length == 20
+        assert stats.chain_lengths[0] == stats.number_of_buckets - 1
+        assert stats.resizes > 0 and stats.resize_time > 0
+
+    def test_instrument_samples_slow_operations(self, populated_hashmap: HashMap[int, str]):
+        seen = []
+        populated_hashmap.instrument(slow_threshold=0, on_slow_operation=seen.append)
+        assert populated_hashmap[3] == "3"
+        stats = populated_hashmap.stats()
+        assert stats.hash_time > 0
+        assert [(sample.operation, sample.key) for sample in stats.slow_operations] == [("lookup", 3)]
+        assert seen == stats.slow_operations
+
+    def test_instrument_leaves_the_global_random_sequence_alone(self, populated_hashmap: HashMap[int, str]):
+        populated_hashmap.instrument(sample_rate=0.5)
+        random.seed(7)
+        expected = [random.random() for _ in range(5)]
+        random.seed(7)
+        for i in range(10):
+            populated_hashmap.get(i)
+        assert [random.random() for _ in range(5)] == expected
@@ -142,4 +142,110 @@ class TestLinkedList:
         with pytest.raises(ValueError):
             linked_list.insert_after(10, 99)  # Target not in list
         with pytest.raises(ValueError):
-            linked_list.remove(10)  # Item not in list
\ No newline at end of file
+            linked_list.remove(10)  # Item not in list
+
+    def test_nodes_are_slotted(self, linked_list: ILinkedList[int]) -> None:
+        assert not hasattr(linked_list.head, '__dict__')
+
+    def test_validate_types_can_be_disabled(self) -> None:
+        linked_list = LinkedList[int].from_sequence([1, "two"], data_type=int, validate_types=False)
+        linked_list.append(3.0)
+        assert list(linked_list) == [1, "two", 3.0]
+
+    def test_nested_iteration_is_independent(self, linked_list: ILinkedList[int]) -> None:
+        pairs = [(a, b) for a in linked_list for b in linked_list]
+        assert len(pairs) == 25
+        iterator = iter(linked_list)
+        assert next(iterator) == 0
+        assert str(linked_list) == '[0, 1, 2, 3, 4]'
+        assert next(iterator) == 1
+
+    def test_modification_during_iteration_raises(self, linked_list: ILinkedList[int]) -> None:
+        with pytest.raises(RuntimeError):
+            for item in linked_list:
+                linked_list.append(item)
+        with pytest.raises(RuntimeError):
+            for item in reversed(linked_list):
+                linked_list.pop_front()
+
+    def test_node_handles(self, empty: ILinkedList[int]) -> None:
+        first = empty.append(1)
+        last = empty.append(3)
+        middle = empty.insert_after_node(first, 2)
+        empty.insert_before_node(first, 0)
+        assert list(empty) == [0, 1, 2, 3]
+        assert empty.find(2) is middle
+        assert empty.unlink(middle) == 2
+        empty.move_to_front(last)
+        assert list(empty) == [3, 0, 1]
+        assert list(reversed(empty)) == [1, 0, 3]
+        with pytest.raises(ValueError):
+            empty.unlink(middle)
+
+    def test_stale_node_handles_are_rejected(self, empty: ILinkedList[int]) -> None:
+        empty.append(1)
+        middle = empty.append(2)
+        empty.append(3)
+        empty.unlink(middle)
+        with pytest.raises(ValueError):
+            empty.insert_before_node(middle, 9)
+        with pytest.raises(ValueError):
+            empty.insert_after_node(middle, 9)
+        assert list(empty) == [1, 3]
+        assert len(empty) == 2
+        last = empty.tail
+        empty.clear()
+        with pytest.raises(ValueError):
+            empty.unlink(last)
+        assert empty.empty and empty.head is None and empty.tail is None
+
+    def test_remove_all_removes_adjacent_matches(self) -> None:
+        linked_list = LinkedList[int].from_sequence([2, 2, 0, 2, 2, 1, 2], data_type=int)
+        assert linked_list.remove_all(2) == 5
+        assert list(linked_list) == [0, 1]
+        assert list(reversed(linked_list)) == [1, 0]
+        assert len(linked_list) == 2
+
+    def test_remove_if_and_retain_if(self) -> None:
+        linked_list = LinkedList[int].from_sequence(list(range(10)), data_type=int)
+        assert linked_list.remove_if(lambda item: item % 3 == 0) == 4
+        assert list(linked_list) == [1, 2, 4, 5, 7, 8]
+        assert linked_list.retain_if(lambda item: item > 4) == 3
+        assert list(linked_list) == [5, 7, 8]
+        assert linked_list.retain_if(lambda item: False) == 3
+        assert linked_list.empty and linked_list.head is None and linked_list.tail is None
+
+    def test_remove_if_calls_predicate_once_per_item(self) -> None:
+        linked_list = LinkedList[int].from_sequence([1, 2, 3, 4], data_type=int)
+        calls = []
+        assert linked_list.remove_if(lambda item: calls.append(item) or item % 2 == 0) == 2
+        assert calls == [1, 2, 3, 4]
+        assert list(linked_list) == [1, 3]
+        answers = iter([True, False] * 4)
+        linked_list = LinkedList[int].from_sequence(list(range(8)), data_type=int)
+        assert linked_list.remove_if(lambda item: next(answers)) == 4
+        assert list(linked_list) == [1, 3, 5, 7]
+        assert list(reversed(linked_list)) == [7, 5, 3, 1]
+
+    def test_extend_links_the_chain_once(self, linked_list: ILinkedList[int]) -> None:
+        linked_list.extend(range(5, 8))
+        assert list(linked_list) == [0, 1, 2, 3, 4, 5, 6, 7]
+        assert list(reversed(linked_list)) == [7, 6, 5, 4, 3, 2, 1, 0]
+        with pytest.raises(TypeError):
+            linked_list.extend([8, "nine"])
+        assert len(linked_list) == 8
+
+    def test_splice_and_concat_move_nodes(self, linked_list: ILinkedList[int]) -> None:
+        other = LinkedList[int].from_sequence([10, 11], data_type=int)
+        moved = other.head
+        linked_list.splice(other, linked_list.find(2))
+        assert list(linked_list) == [0, 1, 10, 11, 2, 3, 4]
+        assert other.empty and list(other) == []
+        assert linked_list.unlink(moved) == 10
+        linked_list.concat(LinkedList[int].from_sequence([5], data_type=int))
+        assert list(reversed(linked_list)) == [5, 4, 3, 2, 11, 1, 0]
+        assert len(linked_list) == 7
+        with pytest.raises(TypeError):
+            linked_list.concat(LinkedList[str].from_sequence(["x"], data_type=str))
+        with pytest.raises(ValueError):
+            linked_list.concat(linked_list)
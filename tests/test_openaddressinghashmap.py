@@ -0,0 +1,44 @@
+from datastructures.openaddressinghashmap import OpenAddressingHashMap
+import pytest
+
+# Behavior shared with the other engines is tested in test_hashmap.py.
+class TestOpenAddressingHashMap:
+
+    def test_lookup_probes_past_tombstones(self):
+        hashmap = OpenAddressingHashMap[int, str](custom_hash_function=lambda key: 0)
+        for i in range(4):
+            hashmap[i] = str(i)
+        del hashmap[1]
+        assert hashmap[3] == "3"
+        hashmap[1] = "one"
+        assert hashmap[1] == "one"
+        assert len(hashmap) == 4
+
+    def test_tombstones_are_purged_without_growing(self):
+        hashmap = OpenAddressingHashMap[int, str]()
+        for i in range(1000):
+            hashmap[i] = str(i)
+            del hashmap[i]
+        assert len(hashmap) == 0
+        assert hashmap.number_of_buckets == 7
+
+    def test_invalid_load_factor(self):
+        with pytest.raises(ValueError):
+            OpenAddressingHashMap(load_factor=1.0)
+
+    def test_compact_purges_tombstones(self):
+        hashmap = OpenAddressingHashMap.from_items((i, str(i)) for i in range(10))
+        del hashmap[1]
+        del hashmap[2]
+        assert hashmap.filled == 10
+        hashmap.compact()
+        assert hashmap.filled == 8
+        assert sorted(hashmap) == [0] + list(range(3, 10))
+
+    def test_stats_report_probe_lengths(self):
+        hashmap = OpenAddressingHashMap[int, str](number_of_buckets=16, custom_hash_function=lambda key: 0)
+        for i in range(4):
+            hashmap[i] = str(i)
+        stats = hashmap.stats()
+        assert stats.chain_lengths == {1: 1, 2: 1, 3: 1, 4: 1}
+        assert stats.max_chain_length == 4